@@ -0,0 +1,22 @@
+"""Wire format for EventBus events streamed to API clients.
+
+Shared by the WebSocket endpoint and the relay connector so both send
+identical event frames.
+"""
+
+from __future__ import annotations
+
+
+def event_payload(event) -> dict:
+    """Build the WebSocket frame for one EventBus event."""
+    return {
+        "type": "event",
+        "agent_id": event.agent_id,
+        "event_type": event.event_type,
+        "timestamp": (
+            event.timestamp.isoformat()
+            if hasattr(event.timestamp, "isoformat")
+            else str(event.timestamp)
+        ),
+        "detail": event.detail,
+    }
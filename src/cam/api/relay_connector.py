@@ -23,6 +23,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+
+from cam.api.events import event_payload
+
 logger = logging.getLogger(__name__)
 
 
@@ -217,22 +220,16 @@ async def _handle_ws_stream(ws, req_id: str, path: str, app) -> None:
             except asyncio.TimeoutError:
                 continue
 
-            payload = {
-                "id": req_id,
-                "event": {
-                    "type": "event",
-                    "agent_id": event.agent_id,
-                    "event_type": event.event_type,
-                    "timestamp": (
-                        event.timestamp.isoformat()
-                        if hasattr(event.timestamp, "isoformat")
-                        else str(event.timestamp)
-                    ),
-                    "detail": event.detail,
-                },
-            }
+            # Drain whatever else is already queued before waiting again.
+            batch = [event]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
             try:
-                await ws.send(json.dumps(payload))
+                for event in batch:
+                    await ws.send(json.dumps({"id": req_id, "event": event_payload(event)}))
             except Exception:
                 break
     finally:
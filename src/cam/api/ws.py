@@ -12,6 +12,8 @@ import logging
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
+from cam.api.events import event_payload
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -60,18 +62,14 @@ async def ws_event_stream(
                 await _poll_status_changes(websocket, state, agent_id)
                 continue
 
-            payload = {
-                "type": "event",
-                "agent_id": event.agent_id,
-                "event_type": event.event_type,
-                "timestamp": (
-                    event.timestamp.isoformat()
-                    if hasattr(event.timestamp, "isoformat")
-                    else str(event.timestamp)
-                ),
-                "detail": event.detail,
-            }
-            await websocket.send_json(payload)
+            # Send everything already queued before waiting again, so a burst
+            # of events costs one wait_for (task + timer) instead of one each.
+            while True:
+                await websocket.send_json(event_payload(event))
+                try:
+                    event = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
     except WebSocketDisconnect:
         logger.debug("WebSocket client disconnected")
     except Exception as e:
@@ -84,6 +84,10 @@ CONTEXT_FILE = os.path.join(CAM_DIR, "context.json")
 
 _DEFAULT_CONTEXT = {"name": None, "host": None, "port": None}
 
+# Startup readiness polling bounds (seconds)
+_STARTUP_POLL_MIN = 0.25
+_STARTUP_POLL_MAX = 1.0
+
 
 def _load_default_context():
     """Load default context from ~/.cam/context.json.
@@ -199,9 +203,16 @@ def cmd_run(args):
     # Startup: wait for readiness, auto-confirm, send prompt
     if config.prompt_after_launch:
         elapsed, confirmed = 0.0, False
+        # Poll quickly at first so fast-starting tools are caught early,
+        # backing off while the screen is unchanged (nothing new to detect).
+        interval, prev_output = _STARTUP_POLL_MIN, None
         while elapsed < config.startup_wait:
-            time.sleep(1); elapsed += 1
+            time.sleep(interval); elapsed += interval
             output = capture_tmux(session)
+            if output == prev_output:
+                interval = min(interval * 2, _STARTUP_POLL_MAX)
+                continue
+            prev_output, interval = output, _STARTUP_POLL_MIN
             if not output.strip():
                 continue
             if confirmed and is_ready_for_input(output, config):
@@ -210,6 +221,7 @@ def cmd_run(args):
             if confirm:
                 tmux_send_input(session, confirm[0], send_enter=confirm[1])
                 confirmed = True
+                prev_output = None  # re-evaluate the screen after confirming
                 time.sleep(3); elapsed += 3
                 continue
             if is_ready_for_input(output, config):
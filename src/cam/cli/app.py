@@ -1,7 +1,7 @@
 """CAM CLI — Root Typer Application.
 
 This is the entry point for the ``cam`` command. It defines the main Typer app,
-global options (--json, --verbose, --config, --data-dir), and lazy-initialised
+global options (--json, --ndjson, --verbose, --config, --data-dir), and lazy-initialised
 shared state that subcommands access via ``from cam.cli.app import state``.
 
 Subcommand registration:
@@ -16,7 +16,7 @@ from __future__ import annotations
 import typer
 
 from cam import __version__
-from cam.cli.formatters import set_json_mode
+from cam.cli.formatters import set_json_mode, set_ndjson_mode
 
 # ---------------------------------------------------------------------------
 # Main Typer app
@@ -151,6 +151,11 @@ def main_callback(
         "--json",
         help="Output as JSON instead of Rich tables.",
     ),
+    ndjson_output: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Output lists as newline-delimited JSON, one object per line (implies --json).",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -169,11 +174,12 @@ def main_callback(
     ),
 ) -> None:
     """CAM \u2014 Coding Agent Manager."""
-    state.json_mode = json_output
+    state.json_mode = json_output or ndjson_output
     state.verbose = verbose
     state.config_path = config
     state.data_dir = data_dir
     set_json_mode(json_output)
+    set_ndjson_mode(ndjson_output)
 
 
 # ---------------------------------------------------------------------------
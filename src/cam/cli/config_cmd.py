@@ -6,11 +6,31 @@ the CAM configuration.
 
 from __future__ import annotations
 
-from typing import Optional
+import copy
+import io
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, TextIO
 
 import typer
-
-from cam.cli.formatters import console, is_json_mode, print_error, print_info, print_json, print_success
+from pydantic import BaseModel
+
+try:
+    import tomli_w
+except ImportError:  # optional; fall back to the built-in writer below
+    tomli_w = None
+
+from cam.cli.formatters import (
+    console,
+    is_json_mode,
+    print_error,
+    print_info,
+    print_json_raw,
+    print_success,
+    print_warning,
+)
+from cam.constants import CONFIG_DIR
 
 app = typer.Typer(help="Manage CAM configuration", no_args_is_help=True)
 
@@ -29,29 +49,31 @@ def config_show(
     from cam.cli.app import state
 
     config = state.config
-    config_dict = config.model_dump(mode="json")
 
+    include = None
     if section:
-        if section in config_dict:
-            data = {section: config_dict[section]}
-        else:
+        sections = type(config).model_fields
+        if section not in sections:
             print_error(f"Unknown config section: {section}")
-            print_info(f"Available sections: {', '.join(config_dict.keys())}")
+            print_info(f"Available sections: {', '.join(sections)}")
             raise typer.Exit(1)
-    else:
-        data = config_dict
+        include = {section}
 
     if is_json_mode():
-        print_json(data)
+        # Serialize straight from the model; no intermediate dict.
+        print_json_raw(config.model_dump_json(indent=2, include=include))
         return
 
     from rich.panel import Panel
 
-    lines = []
-    _format_dict(data, lines, indent=0)
+    # Rich output reads attributes straight off the model; no dump needed.
+    data = {section: getattr(config, section)} if section else config
+
+    buf = io.StringIO()
+    _format_dict(data, buf)
 
     panel = Panel(
-        "\n".join(lines),
+        buf.getvalue().rstrip("\n"),
         title="CAM Configuration",
         title_align="left",
         border_style="blue",
@@ -74,28 +96,11 @@ def config_set(
         cam config set monitor.poll_interval 5
         cam config set general.auto_confirm false
     """
-    from pathlib import Path
-
-    from cam.constants import CONFIG_DIR
-
     config_file = CONFIG_DIR / "config.toml"
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     # Parse existing config
-    existing: dict = {}
-    if config_file.exists():
-        try:
-            import tomllib
-            with open(config_file, "rb") as f:
-                existing = tomllib.load(f)
-        except ImportError:
-            try:
-                import tomli as tomllib  # type: ignore[no-redef]
-                with open(config_file, "rb") as f:
-                    existing = tomllib.load(f)
-            except ImportError:
-                print_error("Cannot read TOML config. Install Python 3.11+ or 'pip install tomli'")
-                raise typer.Exit(1)
+    existing = _load_config_toml(config_file)
 
     # Parse key path
     parts = key.split(".")
@@ -103,37 +108,27 @@ def config_set(
         print_error("Key must use dot notation (e.g. 'monitor.poll_interval')")
         raise typer.Exit(1)
 
-    # Auto-convert value types
-    parsed_value: str | int | float | bool = value
-    if value.lower() in ("true", "yes"):
-        parsed_value = True
-    elif value.lower() in ("false", "no"):
-        parsed_value = False
-    else:
-        try:
-            parsed_value = int(value)
-        except ValueError:
-            try:
-                parsed_value = float(value)
-            except ValueError:
-                pass  # Keep as string
+    parsed_value = _parse_value(value)
 
     # Set nested value
     target = existing
     for part in parts[:-1]:
-        if part not in target:
-            target[part] = {}
-        target = target[part]
+        target = target.setdefault(part, {})
+        if not isinstance(target, dict):
+            print_error(f"Key path '{key}' conflicts with existing scalar value at '{part}'")
+            raise typer.Exit(1)
     target[parts[-1]] = parsed_value
 
-    # Write back as TOML
+    # Write back as TOML: fill a temp file, then rename it over the config
+    # so a crash mid-write never leaves a truncated config behind.
+    tmp_file = config_file.with_suffix(config_file.suffix + ".tmp")
     try:
-        import tomli_w
-        with open(config_file, "wb") as f:
-            tomli_w.dump(existing, f)
-    except ImportError:
-        # Fallback: write manually
-        _write_toml_simple(config_file, existing)
+        _write_toml(tmp_file, existing)
+        os.replace(tmp_file, config_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    _read_toml_cached.cache_clear()
 
     print_success(f"Set {key} = {parsed_value}")
     print_info(f"Config file: {config_file}")
@@ -147,10 +142,6 @@ def config_reset(
 
     Deletes the global config file at ~/.config/cam/config.toml.
     """
-    from pathlib import Path
-
-    from cam.constants import CONFIG_DIR
-
     config_file = CONFIG_DIR / "config.toml"
 
     if not config_file.exists():
@@ -158,7 +149,6 @@ def config_reset(
         return
 
     if not force:
-        from cam.cli.formatters import print_warning
         print_warning(f"This will delete: {config_file}")
         confirm = typer.confirm("Are you sure?")
         if not confirm:
@@ -169,56 +159,129 @@ def config_reset(
     print_success("Configuration reset to defaults")
 
 
-def _format_dict(data: dict, lines: list[str], indent: int = 0) -> None:
-    """Recursively format a dict for display."""
-    prefix = "  " * indent
-    for key, value in data.items():
-        if isinstance(value, dict):
-            lines.append(f"{prefix}[bold]{key}:[/bold]")
-            _format_dict(value, lines, indent + 1)
-        elif isinstance(value, list):
-            if value:
-                lines.append(f"{prefix}[bold]{key}:[/bold] {', '.join(str(v) for v in value)}")
-            else:
-                lines.append(f"{prefix}[bold]{key}:[/bold] []")
+_TRUE_WORDS = frozenset(("true", "yes"))
+_FALSE_WORDS = frozenset(("false", "no"))
+
+
+def _parse_value(value: str) -> str | int | float | bool:
+    """Auto-convert a CLI value to bool, int, or float; otherwise keep the string."""
+    lowered = value.lower()
+    if lowered in _TRUE_WORDS:
+        return True
+    if lowered in _FALSE_WORDS:
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _load_config_toml(path: Path) -> dict:
+    """Load a TOML config file, reusing the parse while the file is unchanged.
+
+    Returns a deep copy so callers can mutate the result freely.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return copy.deepcopy(_read_toml_cached(str(path), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _read_toml_cached(path: str, mtime_ns: int) -> dict:
+    """Parse *path*; ``mtime_ns`` is only part of the cache key."""
+    from cam.core.config import read_toml
+
+    return read_toml(path)
+
+
+_INDENT_PREFIXES = ("", "  ", "    ", "      ", "        ")
+
+
+def _format_dict(data: dict | BaseModel, out: io.StringIO, indent: int = 0) -> None:
+    """Recursively format a dict or pydantic model for display, one line per key."""
+    prefix = _INDENT_PREFIXES[indent] if indent < len(_INDENT_PREFIXES) else "  " * indent
+    if isinstance(data, BaseModel):
+        items = ((name, getattr(data, name)) for name in type(data).model_fields)
+    else:
+        items = data.items()
+    for key, value in items:
+        out.write(prefix)
+        out.write("[bold]")
+        out.write(str(key))
+        if isinstance(value, (dict, BaseModel)):
+            out.write(":[/bold]\n")
+            _format_dict(value, out, indent + 1)
+            continue
+        out.write(":[/bold] ")
+        if isinstance(value, list):
+            out.write(", ".join(str(v) for v in value) if value else "[]")
         else:
-            lines.append(f"{prefix}[bold]{key}:[/bold] {value}")
+            out.write(str(value))
+        out.write("\n")
+
+
+def _write_toml_tomli_w(path, data: dict) -> None:
+    """Write *data* with tomli_w and fsync it."""
+    with open(path, "wb") as f:
+        tomli_w.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
 
 
 def _write_toml_simple(path, data: dict) -> None:
     """Simple TOML writer for nested dicts (no tomli_w dependency)."""
-    lines: list[str] = []
-    _write_toml_section(data, lines, [])
+    # The text file is already buffered, so stream straight into it.
     with open(path, "w") as f:
-        f.write("\n".join(lines) + "\n")
+        _write_toml_section(data, f, "")
+        f.flush()
+        os.fsync(f.fileno())
 
 
-def _write_toml_section(data: dict, lines: list[str], path: list[str]) -> None:
-    """Write a TOML section recursively."""
-    # First write scalar values at this level
-    for key, value in data.items():
-        if not isinstance(value, dict):
-            lines.append(f"{key} = {_toml_value(value)}")
+def _write_toml_section(data: dict, out: TextIO, table: str) -> None:
+    """Write a TOML section recursively.
 
-    # Then write nested sections
+    Scalars are written in a single pass; nested tables are deferred so
+    they follow all of this section's key/value pairs, as TOML requires.
+    ``table`` is the dotted name of the current table ("" at the root).
+    """
+    nested = []
     for key, value in data.items():
         if isinstance(value, dict):
-            section_path = path + [key]
-            lines.append("")
-            lines.append(f"[{'.'.join(section_path)}]")
-            _write_toml_section(value, lines, section_path)
+            nested.append((key, value))
+        else:
+            out.write(f"{key} = {_toml_value(value)}\n")
+
+    for key, value in nested:
+        sub_table = f"{table}.{key}" if table else key
+        out.write(f"\n[{sub_table}]\n")
+        _write_toml_section(value, out, sub_table)
+
+
+_TOML_FORMATTERS = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+    str: lambda v: f'"{v}"',
+}
 
 
 def _toml_value(value) -> str:
     """Convert a Python value to TOML representation."""
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    elif isinstance(value, (int, float)):
-        return str(value)
-    elif isinstance(value, str):
-        return f'"{value}"'
-    elif isinstance(value, list):
+    # Exact-type lookup: bool must not fall through to int's formatter.
+    formatter = _TOML_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, list):
         items = ", ".join(_toml_value(v) for v in value)
         return f"[{items}]"
-    else:
-        return f'"{value}"'
+    return f'"{value}"'
+
+
+# Resolved once: tomli_w when installed, otherwise the simple writer.
+_write_toml = _write_toml_tomli_w if tomli_w is not None else _write_toml_simple
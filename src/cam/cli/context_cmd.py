@@ -6,6 +6,8 @@ Provides the `cam context` sub-command for managing work contexts.
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
@@ -17,18 +19,23 @@ from cam.cli.formatters import (
     print_context_list,
     print_error,
     print_info,
+    print_messages,
     print_success,
     print_warning,
 )
 from cam.core.models import Context, MachineConfig, TransportType
+from cam.storage.context_store import ContextStoreError
 
 app = typer.Typer(help="Manage work contexts", no_args_is_help=True)
 
+_TRANSPORT_BY_NAME = {t.value: t for t in TransportType}
+_VALID_TRANSPORT_TYPES = ", ".join(_TRANSPORT_BY_NAME)
+
 
 @app.command("add")
 def context_add(
-    name: str = typer.Argument(..., help="Context name (unique)"),
-    path: str = typer.Argument(..., help="Working directory path"),
+    name: Optional[str] = typer.Argument(None, help="Context name (unique)"),
+    path: Optional[str] = typer.Argument(None, help="Working directory path"),
     host: Optional[str] = typer.Option(None, "--host", help="SSH hostname"),
     user: Optional[str] = typer.Option(None, "--user", help="SSH username"),
     port: int = typer.Option(22, "--port", help="SSH port"),
@@ -40,6 +47,10 @@ def context_add(
     docker: Optional[str] = typer.Option(None, "--docker", help="Docker image"),
     env_setup: Optional[str] = typer.Option(None, "--env-setup", help="Shell commands to run before agent (e.g. PATH setup)"),
     tag: Optional[list[str]] = typer.Option(None, "--tag", help="Tags (repeatable)"),
+    from_file: Optional[str] = typer.Option(
+        None, "--from-file",
+        help="Add every context in a JSON array (objects with name, path, and optional machine/tags)",
+    ),
 ) -> None:
     """Add a new work context.
 
@@ -49,9 +60,20 @@ def context_add(
         cam context add remote /path --host srv --env-setup "source /opt/env.sh"
         cam context add agent-ctx /path --agent --host localhost
         cam context add container /app --docker python:3.11
+        cam context add --from-file contexts.json
     """
     from cam.cli.app import state
-    from cam.storage.context_store import ContextStoreError
+
+    if from_file:
+        if name or path:
+            print_error("--from-file cannot be combined with NAME/PATH arguments")
+            raise typer.Exit(1)
+        _add_contexts_from_file(state.context_store, from_file)
+        return
+
+    if not name or not path:
+        print_error("NAME and PATH are required (or use --from-file)")
+        raise typer.Exit(1)
 
     # Determine transport type from options
     if docker:
@@ -71,7 +93,7 @@ def context_add(
         raise typer.Exit(1)
 
     # Validate path is absolute
-    if not path.startswith("/"):
+    if not os.path.isabs(path):
         print_error(f"Path must be absolute: {path}")
         raise typer.Exit(1)
 
@@ -113,6 +135,46 @@ def context_add(
         raise typer.Exit(1)
 
 
+def _add_contexts_from_file(context_store, file_path: str) -> None:
+    """Load a JSON array of context definitions and add them in one batch."""
+    try:
+        with open(file_path) as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print_error(f"Cannot read {file_path}: {e}")
+        raise typer.Exit(1)
+    if not isinstance(entries, list):
+        print_error(f"{file_path} must contain a JSON array of contexts")
+        raise typer.Exit(1)
+
+    now = datetime.now(timezone.utc)
+    contexts = []
+    try:
+        for entry in entries:
+            context = Context(
+                id=str(uuid4()),
+                name=entry.get("name", ""),
+                path=entry.get("path", ""),
+                machine=MachineConfig(**entry.get("machine", {})),
+                tags=entry.get("tags", []),
+                created_at=now,
+            )
+            if not os.path.isabs(context.path):
+                print_error(f"Path must be absolute: {context.path} (context '{context.name}')")
+                raise typer.Exit(1)
+            contexts.append(context)
+    except (AttributeError, TypeError, ValueError) as e:
+        print_error(f"Invalid context data: {e}")
+        raise typer.Exit(1)
+
+    try:
+        context_store.add_many(contexts)
+    except ContextStoreError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+    print_success(f"Added {len(contexts)} context(s) from {file_path}")
+
+
 @app.command("list")
 def context_list(
     tag: Optional[str] = typer.Option(None, "--tag", help="Filter by tag"),
@@ -130,11 +192,9 @@ def context_list(
     # Parse transport type
     transport_type = None
     if type:
-        try:
-            transport_type = TransportType(type.lower())
-        except ValueError:
-            valid_types = ", ".join(t.value for t in TransportType)
-            print_error(f"Invalid transport type: {type}. Valid types: {valid_types}")
+        transport_type = _TRANSPORT_BY_NAME.get(type.lower())
+        if transport_type is None:
+            print_error(f"Invalid transport type: {type}. Valid types: {_VALID_TRANSPORT_TYPES}")
             raise typer.Exit(1)
 
     # Build filters
@@ -227,7 +287,6 @@ def context_remove(
         cam context remove old-project --force
     """
     from cam.cli.app import state
-    from cam.storage.context_store import ContextStoreError
 
     ctx = state.context_store.get(name_or_id)
     if not ctx:
@@ -272,7 +331,6 @@ def context_copy(
         cam context copy remote-server remote-server-staging
     """
     from cam.cli.app import state
-    from cam.storage.context_store import ContextStoreError
 
     src = state.context_store.get(source)
     if not src:
@@ -320,61 +378,62 @@ def context_update(
         cam context update myproject --remove-tag old-tag
     """
     from cam.cli.app import state
-    from cam.storage.context_store import ContextStoreError
 
     ctx = state.context_store.get(name_or_id)
     if not ctx:
         print_error(f"Context not found: {name_or_id}")
         raise typer.Exit(1)
 
-    # Track if anything changed
+    # Track if anything changed; notes are printed together in one render
     changed = False
+    notes: list[tuple[str, str]] = []
 
     # Update path
     if path:
-        if not path.startswith("/"):
+        if not os.path.isabs(path):
             print_error(f"Path must be absolute: {path}")
             raise typer.Exit(1)
         ctx.path = path
         changed = True
-        print_info(f"Updated path to: {path}")
+        notes.append(("info", f"Updated path to: {path}"))
 
     # Update env_setup
     if env_setup is not None:
         ctx.machine.env_setup = env_setup if env_setup else None
         changed = True
-        print_info(f"Updated env_setup to: {env_setup or '(cleared)'}")
+        notes.append(("info", f"Updated env_setup to: {env_setup or '(cleared)'}"))
+
+    # Add/remove tags against an insertion-ordered set (dict keys)
+    if add_tag or remove_tag:
+        tags = dict.fromkeys(ctx.tags)
 
-    # Add tags
-    if add_tag:
-        for tag_name in add_tag:
-            if tag_name not in ctx.tags:
-                ctx.tags.append(tag_name)
+        for tag_name in add_tag or []:
+            if tag_name not in tags:
+                tags[tag_name] = None
                 changed = True
-                print_info(f"Added tag: {tag_name}")
+                notes.append(("info", f"Added tag: {tag_name}"))
             else:
-                print_warning(f"Tag already exists: {tag_name}")
+                notes.append(("warning", f"Tag already exists: {tag_name}"))
 
-    # Remove tags
-    if remove_tag:
-        for tag_name in remove_tag:
-            if tag_name in ctx.tags:
-                ctx.tags.remove(tag_name)
+        for tag_name in remove_tag or []:
+            if tag_name in tags:
+                del tags[tag_name]
                 changed = True
-                print_info(f"Removed tag: {tag_name}")
+                notes.append(("info", f"Removed tag: {tag_name}"))
             else:
-                print_warning(f"Tag not found: {tag_name}")
+                notes.append(("warning", f"Tag not found: {tag_name}"))
+
+        ctx.tags = list(tags)
+
+    print_messages(notes)
 
     if not changed:
         print_info("No changes made")
         return
 
     # Save updated context
-    # Note: This requires implementing an update method in ContextStore
-    # For now, we'll remove and re-add
     try:
-        state.context_store.remove(str(ctx.id))
-        state.context_store.add(ctx)
+        state.context_store.update(ctx)
         print_success(f"Context '{ctx.name}' updated")
         print_context_detail(ctx)
     except ContextStoreError as e:
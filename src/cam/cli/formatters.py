@@ -8,15 +8,21 @@ Supports colored tables, panels, and structured data display.
 from __future__ import annotations
 
 import json
+import os
 import sys
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from pydantic import BaseModel, TypeAdapter
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+from cam.constants import PID_DIR
 from cam.core.models import (
     Agent,
     AgentState,
@@ -25,12 +31,54 @@ from cam.core.models import (
     TransportType,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+
+class _LazyConsole:
+    """Stand-in for a Rich Console that is only built on first use.
+
+    Importing Rich dominates CLI startup; ``cam --json ...`` never renders
+    through Rich, so it should not pay for that import.
+    """
+
+    __slots__ = ("_kwargs", "_console")
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs = kwargs
+        self._console: Console | None = None
+
+    def _get(self) -> Console:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+
 # Console instances for normal and error output
-console = Console()
-error_console = Console(stderr=True)
+console = _LazyConsole()
+error_console = _LazyConsole(stderr=True)
 
 # Global state for JSON mode
 _json_mode = False
+# NDJSON mode: list output as one compact JSON object per line (implies JSON)
+_ndjson_mode = False
+
+_ORJSON_LINE_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+_ORJSON_OPTIONS = _ORJSON_LINE_OPTIONS | orjson.OPT_INDENT_2 if orjson is not None else 0
+
+# Reusable pydantic-core serializers for JSON-mode list output
+_context_list_adapter = TypeAdapter(list[Context])
+_agent_list_adapter = TypeAdapter(list[Agent])
 
 
 def set_json_mode(enabled: bool) -> None:
@@ -44,6 +92,19 @@ def is_json_mode() -> bool:
     return _json_mode
 
 
+def set_ndjson_mode(enabled: bool) -> None:
+    """Enable or disable NDJSON output mode (also switches JSON mode on)."""
+    global _ndjson_mode, _json_mode
+    _ndjson_mode = enabled
+    if enabled:
+        _json_mode = True
+
+
+def is_ndjson_mode() -> bool:
+    """Check if NDJSON output mode is enabled."""
+    return _ndjson_mode
+
+
 # --- Status and state styling ---
 
 STATUS_STYLES = {
@@ -109,32 +170,136 @@ def print_info(message: str) -> None:
         console.print(f"[cyan]ℹ[/cyan] {message}")
 
 
+_MESSAGE_ICONS = {
+    "success": "[green]✓[/green]",
+    "warning": "[yellow]⚠[/yellow]",
+    "info": "[cyan]ℹ[/cyan]",
+}
+
+
+def print_messages(messages: list[tuple[str, str]]) -> None:
+    """Print several ``(status, message)`` notes in one render.
+
+    ``status`` is "success", "warning", or "info"; each note looks the same
+    as the matching ``print_*`` call would print it.
+    """
+    if not messages:
+        return
+    if _json_mode:
+        for status, message in messages:
+            print_json({"status": status, "message": message})
+    else:
+        console.print("\n".join(f"{_MESSAGE_ICONS[status]} {message}" for status, message in messages))
+
+
+# --- Detail panels ---
+
+class _DetailLines:
+    """Collects the lines of a detail panel as Rich ``Text`` objects.
+
+    Values are appended as plain text, never parsed as markup, so the panel
+    skips the markup parser and stray brackets in names or prompts render
+    literally. Parts may be strings, ``(text, style)`` pairs or ``Text``.
+    """
+
+    __slots__ = ("_lines", "_text")
+
+    def __init__(self) -> None:
+        from rich.text import Text
+
+        self._text = Text
+        self._lines: list[Text] = []
+
+    def field(self, label: str, *parts: Any) -> None:
+        """Add a ``Label: value`` line with the label in bold."""
+        self.line((label, "bold"), " ", *parts)
+
+    def line(self, *parts: Any) -> None:
+        self._lines.append(
+            self._text.assemble(
+                *(p if isinstance(p, (tuple, self._text)) else str(p) for p in parts)
+            )
+        )
+
+    def blank(self) -> None:
+        self._lines.append(self._text())
+
+    def group(self) -> Any:
+        """Return the collected lines as a renderable Group."""
+        from rich.console import Group
+
+        return Group(*self._lines)
+
+
 # --- Context formatting ---
 
+# Column specs for the list tables: (header, Column keyword arguments).
+_CONTEXT_COLUMNS = (
+    ("ID", {"style": "dim", "no_wrap": True}),
+    ("Name", {"style": "bold cyan"}),
+    ("Type", {"style": "magenta"}),
+    ("Machine", {}),
+    ("Path", {"style": "blue"}),
+    ("Tags", {"style": "dim"}),
+)
+
+_AGENT_COLUMNS_HEAD = (
+    ("#", {"style": "bold yellow", "no_wrap": True}),
+    ("ID", {"style": "dim", "no_wrap": True}),
+    ("Name", {"style": "bold"}),
+)
+_AGENT_COLUMNS_TAIL = (
+    ("Tool", {"style": "bold"}),
+    ("Status", {"no_wrap": True}),
+    ("State", {"no_wrap": True}),
+    ("Context", {"style": "cyan"}),
+    ("Transport", {"style": "magenta"}),
+    ("Duration", {"justify": "right"}),
+)
+_AGENT_COLUMNS = _AGENT_COLUMNS_HEAD + _AGENT_COLUMNS_TAIL
+_AGENT_COLUMNS_TAGGED = (
+    _AGENT_COLUMNS_HEAD + (("Tag", {"style": "cyan", "no_wrap": True}),) + _AGENT_COLUMNS_TAIL
+)
+
+_DOCTOR_COLUMNS = (
+    ("Check", {"style": "bold"}),
+    ("Status", {"no_wrap": True}),
+    ("Details", {}),
+)
+
+
+def build_table(title: str, title_style: str, columns: tuple) -> Any:
+    """Build a Rich Table from a ``(header, column kwargs)`` spec."""
+    from rich.table import Column, Table
+
+    return Table(
+        *(Column(header, **kwargs) for header, kwargs in columns),
+        title=title,
+        title_style=title_style,
+    )
+
+
 def print_context_list(contexts: list[Context]) -> None:
     """Print contexts as a Rich table or JSON array."""
+    if _ndjson_mode:
+        print_ndjson(contexts)
+        return
     if _json_mode:
-        print(json.dumps([c.model_dump(mode="json") for c in contexts], indent=2, default=str))
+        print_json_raw(_context_list_adapter.dump_json(contexts, indent=2, fallback=str))
         return
 
     if not contexts:
         console.print("[dim]No contexts found.[/dim]")
         return
 
-    table = Table(title="Contexts", title_style="bold cyan")
-    table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Name", style="bold cyan")
-    table.add_column("Type", style="magenta")
-    table.add_column("Machine")
-    table.add_column("Path", style="blue")
-    table.add_column("Tags", style="dim")
+    table = build_table("Contexts", "bold cyan", _CONTEXT_COLUMNS)
 
     for ctx in contexts:
         machine_label = format_machine_label(ctx.machine)
         tags_str = ", ".join(ctx.tags) if ctx.tags else "-"
 
         table.add_row(
-            format_short_id(str(ctx.id)),
+            format_short_id(ctx.id),
             ctx.name,
             TRANSPORT_LABELS.get(ctx.machine.type, "?"),
             machine_label,
@@ -148,39 +313,41 @@ def print_context_list(contexts: list[Context]) -> None:
 def print_context_detail(context: Context) -> None:
     """Print detailed context info as a Rich panel or JSON."""
     if _json_mode:
-        print(json.dumps(context.model_dump(mode="json"), indent=2, default=str))
+        print_json_raw(context.model_dump_json(indent=2, fallback=str))
         return
 
-    lines = []
-    lines.append(f"[bold]Name:[/bold] {context.name}")
-    lines.append(f"[bold]ID:[/bold] {context.id}")
-    lines.append(f"[bold]Path:[/bold] {context.path}")
-    lines.append(f"[bold]Transport:[/bold] {TRANSPORT_LABELS.get(context.machine.type, '?')}")
+    from rich.panel import Panel
+
+    out = _DetailLines()
+    out.field("Name:", context.name)
+    out.field("ID:", context.id)
+    out.field("Path:", context.path)
+    out.field("Transport:", TRANSPORT_LABELS.get(context.machine.type, "?"))
 
     # Machine details
     machine_info = format_machine_detail(context.machine)
     if machine_info:
-        lines.append(f"[bold]Machine:[/bold] {machine_info}")
+        out.field("Machine:", machine_info)
 
     # Env setup
     if context.machine.env_setup:
-        lines.append(f"[bold]Env Setup:[/bold] {context.machine.env_setup}")
+        out.field("Env Setup:", context.machine.env_setup)
 
     # Tags
     if context.tags:
-        lines.append(f"[bold]Tags:[/bold] {', '.join(context.tags)}")
+        out.field("Tags:", ", ".join(context.tags))
     else:
-        lines.append("[bold]Tags:[/bold] [dim]none[/dim]")
+        out.field("Tags:", ("none", "dim"))
 
     # Timestamps
-    lines.append(f"[bold]Created:[/bold] {format_timestamp(context.created_at)}")
+    out.field("Created:", format_timestamp(context.created_at))
     if context.last_used_at:
-        lines.append(f"[bold]Last Used:[/bold] {format_timestamp(context.last_used_at)}")
+        out.field("Last Used:", format_timestamp(context.last_used_at))
     else:
-        lines.append("[bold]Last Used:[/bold] [dim]never[/dim]")
+        out.field("Last Used:", ("never", "dim"))
 
     panel = Panel(
-        "\n".join(lines),
+        out.group(),
         title=f"Context: {context.name}",
         title_align="left",
         border_style="cyan",
@@ -192,8 +359,11 @@ def print_context_detail(context: Context) -> None:
 
 def print_agent_list(agents: list[Agent]) -> None:
     """Print agents as a Rich table or JSON array."""
+    if _ndjson_mode:
+        print_ndjson(agents)
+        return
     if _json_mode:
-        print(json.dumps([a.model_dump(mode="json") for a in agents], indent=2, default=str))
+        print_json_raw(_agent_list_adapter.dump_json(agents, indent=2, fallback=str))
         return
 
     if not agents:
@@ -211,28 +381,21 @@ def print_agent_list(agents: list[Agent]) -> None:
 
     any_tags = any(a.task.tags for a in agents)
 
-    table = Table(title="Agents", title_style="bold green")
-    table.add_column("#", style="bold yellow", no_wrap=True)
-    table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Name", style="bold")
-    if any_tags:
-        table.add_column("Tag", style="cyan", no_wrap=True)
-    table.add_column("Tool", style="bold")
-    table.add_column("Status", no_wrap=True)
-    table.add_column("State", no_wrap=True)
-    table.add_column("Context", style="cyan")
-    table.add_column("Transport", style="magenta")
-    table.add_column("Duration", justify="right")
+    table = build_table(
+        "Agents", "bold green", _AGENT_COLUMNS_TAGGED if any_tags else _AGENT_COLUMNS
+    )
 
+    # One clock read for the whole table: running agents' durations share it
+    now = datetime.now(timezone.utc)
     for idx, agent in enumerate(agents, 1):
         status_text = format_status(agent.status)
         state_text = format_state(agent.state)
-        duration_text = format_duration(agent.duration_seconds())
+        duration_text = format_duration(agent.duration_seconds(now))
         transport_label = TRANSPORT_LABELS.get(agent.transport_type, "?")
 
         row = [
             str(idx),
-            format_short_id(str(agent.id)),
+            format_short_id(agent.id),
             agent.task.name or "",
         ]
         if any_tags:
@@ -253,109 +416,115 @@ def print_agent_list(agents: list[Agent]) -> None:
 def print_agent_detail(agent: Agent) -> None:
     """Print detailed agent info as a Rich panel or JSON."""
     if _json_mode:
-        print(json.dumps(agent.model_dump(mode="json"), indent=2, default=str))
+        print_json_raw(agent.model_dump_json(indent=2, fallback=str))
         return
 
-    lines = []
+    from rich.panel import Panel
+
+    out = _DetailLines()
 
     # Basic info
-    lines.append(f"[bold]ID:[/bold] {agent.id}")
-    lines.append(f"[bold]Task:[/bold] {agent.task.name}")
-    lines.append(f"[bold]Tool:[/bold] {agent.task.tool}")
-    lines.append(f"[bold]Status:[/bold] {format_status(agent.status)}")
-    lines.append(f"[bold]State:[/bold] {format_state(agent.state)}")
+    out.field("ID:", agent.id)
+    out.field("Task:", agent.task.name)
+    out.field("Tool:", agent.task.tool)
+    out.field("Status:", format_status(agent.status).plain)
+    out.field("State:", format_state(agent.state).plain)
 
     # Context info
-    lines.append("")
-    lines.append(f"[bold]Context:[/bold] {agent.context_name}")
-    lines.append(f"[bold]Context ID:[/bold] {agent.context_id}")
-    lines.append(f"[bold]Context Path:[/bold] {agent.context_path}")
-    lines.append(f"[bold]Transport:[/bold] {TRANSPORT_LABELS.get(agent.transport_type, '?')}")
+    out.blank()
+    out.field("Context:", agent.context_name)
+    out.field("Context ID:", agent.context_id)
+    out.field("Context Path:", agent.context_path)
+    out.field("Transport:", TRANSPORT_LABELS.get(agent.transport_type, '?'))
 
     # Execution info
-    lines.append("")
+    out.blank()
     if agent.started_at:
-        lines.append(f"[bold]Started:[/bold] {format_timestamp(agent.started_at)}")
+        out.field("Started:", format_timestamp(agent.started_at))
     if agent.completed_at:
-        lines.append(f"[bold]Completed:[/bold] {format_timestamp(agent.completed_at)}")
+        out.field("Completed:", format_timestamp(agent.completed_at))
 
     duration = agent.duration_seconds()
     if duration is not None:
-        lines.append(f"[bold]Duration:[/bold] {format_duration(duration)}")
+        out.field("Duration:", format_duration(duration))
 
     if agent.retry_count > 0:
-        lines.append(f"[bold]Retries:[/bold] {agent.retry_count}")
+        out.field("Retries:", agent.retry_count)
 
     # Tmux session info
     if agent.tmux_session:
-        lines.append("")
-        lines.append(f"[bold]Tmux Session:[/bold] {agent.tmux_session}")
+        out.blank()
+        out.field("Tmux Session:", agent.tmux_session)
         if agent.tmux_socket:
-            lines.append(f"[bold]Tmux Socket:[/bold] {agent.tmux_socket}")
+            out.field("Tmux Socket:", agent.tmux_socket)
 
     # Monitor PID (background monitor subprocess)
-    from cam.constants import PID_DIR
     monitor_pid_path = PID_DIR / f"{agent.id}.pid"
-    if monitor_pid_path.exists():
+    try:
+        # A PID is a few bytes: one open/read/close, no stat or text layer.
+        fd = os.open(monitor_pid_path, os.O_RDONLY)
         try:
-            monitor_pid = int(monitor_pid_path.read_text().strip())
-            lines.append(f"[bold]Monitor PID:[/bold] {monitor_pid} [dim](background)[/dim]")
-        except (ValueError, OSError):
-            pass
+            data = os.read(fd, 32)
+        finally:
+            os.close(fd)
+        monitor_pid = int(data.strip())
+        out.field("Monitor PID:", monitor_pid, " ", ("(background)", "dim"))
+    except (ValueError, OSError):
+        pass
 
     # PID
     if agent.pid:
-        lines.append(f"[bold]PID:[/bold] {agent.pid}")
+        out.field("PID:", agent.pid)
 
     # Exit reason
     if agent.exit_reason:
-        lines.append("")
-        lines.append(f"[bold]Exit Reason:[/bold] {agent.exit_reason}")
+        out.blank()
+        out.field("Exit Reason:", agent.exit_reason)
 
     # Cost estimate
     if agent.cost_estimate is not None:
-        lines.append("")
-        lines.append(f"[bold]Cost Estimate:[/bold] ${agent.cost_estimate:.4f}")
+        out.blank()
+        out.field("Cost Estimate:", f"${agent.cost_estimate:.4f}")
 
     # Files changed
     if agent.files_changed:
-        lines.append("")
-        lines.append(f"[bold]Files Changed:[/bold] {len(agent.files_changed)}")
-        for file_path in agent.files_changed[:5]:  # Show first 5
-            lines.append(f"  • {file_path}")
+        out.blank()
+        out.field("Files Changed:", len(agent.files_changed))
+        for file_path in islice(agent.files_changed, 5):  # Show first 5
+            out.line(f"  • {file_path}")
         if len(agent.files_changed) > 5:
-            lines.append(f"  ... and {len(agent.files_changed) - 5} more")
+            out.line(f"  ... and {len(agent.files_changed) - 5} more")
 
     # Task prompt
-    lines.append("")
-    lines.append("[bold]Prompt:[/bold]")
-    lines.append(f"[dim]{agent.task.prompt}[/dim]")
+    out.blank()
+    out.line(("Prompt:", "bold"))
+    out.line((agent.task.prompt, "dim"))
 
     # Task configuration
     if agent.task.timeout:
-        lines.append("")
-        lines.append(f"[bold]Timeout:[/bold] {agent.task.timeout}s")
+        out.blank()
+        out.field("Timeout:", f"{agent.task.timeout}s")
 
     if agent.task.retry.max_retries > 0:
-        lines.append(f"[bold]Max Retries:[/bold] {agent.task.retry.max_retries}")
+        out.field("Max Retries:", agent.task.retry.max_retries)
 
     if agent.task.env:
-        lines.append("")
-        lines.append("[bold]Environment:[/bold]")
+        out.blank()
+        out.line(("Environment:", "bold"))
         for key, value in agent.task.env.items():
-            lines.append(f"  {key}={value}")
+            out.line(f"  {key}={value}")
 
     # Events
     if agent.events:
-        lines.append("")
-        lines.append(f"[bold]Events:[/bold] {len(agent.events)} total")
+        out.blank()
+        out.field("Events:", f"{len(agent.events)} total")
         for event in agent.events[-5:]:  # Show last 5 events
             event_time = str(event.get("timestamp", ""))[:19] if isinstance(event, dict) else ""
             event_type = event.get("event_type", "") if isinstance(event, dict) else ""
-            lines.append(f"  [dim]{event_time}[/dim] {event_type}")
+            out.line("  ", (event_time, "dim"), f" {event_type}")
 
     panel = Panel(
-        "\n".join(lines),
+        out.group(),
         title=f"Agent: {agent.task.name}",
         title_align="left",
         border_style="green",
@@ -375,28 +544,27 @@ def print_doctor_results(checks: list[dict[str, Any]]) -> None:
         console.print("[dim]No checks performed.[/dim]")
         return
 
-    table = Table(title="System Check Results", title_style="bold yellow")
-    table.add_column("Check", style="bold")
-    table.add_column("Status", no_wrap=True)
-    table.add_column("Details")
+    from rich.text import Text
 
-    for check in checks:
-        name = check.get("name", "Unknown")
-        passed = check.get("passed", False)
-        details = check.get("details", "")
+    table = build_table("System Check Results", "bold yellow", _DOCTOR_COLUMNS)
+
+    pass_text = Text("✓ PASS", style="green")
+    fail_text = Text("✗ FAIL", style="red")
+    passed = 0
 
-        if passed:
-            status = Text("✓ PASS", style="green")
+    for check in checks:
+        if check.get("passed", False):
+            passed += 1
+            status = pass_text
         else:
-            status = Text("✗ FAIL", style="red")
+            status = fail_text
 
-        table.add_row(name, status, details)
+        table.add_row(check.get("name", "Unknown"), status, check.get("details", ""))
 
     console.print(table)
 
     # Summary
     total = len(checks)
-    passed = sum(1 for c in checks if c.get("passed", False))
     failed = total - passed
 
     console.print()
@@ -408,16 +576,35 @@ def print_doctor_results(checks: list[dict[str, Any]]) -> None:
 
 # --- Helper formatting functions ---
 
+# Filled on first use; Rich only reads a Text while drawing a table, so
+# rows can share these instances.  Callers must not mutate the returned Text.
+_STATUS_TEXT: dict[AgentStatus, Text] = {}
+_STATE_TEXT: dict[AgentState, Text] = {}
+
+
 def format_status(status: AgentStatus) -> Text:
     """Format agent status with color and icon."""
-    style, icon = STATUS_STYLES.get(status, ("white", "?"))
-    return Text(f"{icon} {status.value}", style=style)
+    text = _STATUS_TEXT.get(status)
+    if text is None:
+        from rich.text import Text
+
+        style, icon = STATUS_STYLES.get(status, ("white", "?"))
+        text = _STATUS_TEXT[status] = Text(f"{icon} {status.value}", style=style)
+    return text
 
 
 def format_state(state: AgentState) -> Text:
     """Format agent state with color and icon."""
-    style, icon = STATE_STYLES.get(state, ("white", "?"))
-    return Text(f"{icon} {state.value}", style=style)
+    text = _STATE_TEXT.get(state)
+    if text is None:
+        from rich.text import Text
+
+        style, icon = STATE_STYLES.get(state, ("white", "?"))
+        text = _STATE_TEXT[state] = Text(f"{icon} {state.value}", style=style)
+    return text
+
+
+_SECONDS_STRS = tuple(f"{i}s" for i in range(60))
 
 
 def format_duration(seconds: float | None) -> str:
@@ -431,26 +618,28 @@ def format_duration(seconds: float | None) -> str:
     seconds = int(seconds)
 
     if seconds < 60:
-        return f"{seconds}s"
+        return _SECONDS_STRS[seconds]
+    return _format_long_duration(seconds)
+
 
-    minutes = seconds // 60
-    seconds = seconds % 60
+@lru_cache(maxsize=4096)
+def _format_long_duration(seconds: int) -> str:
+    """Format a duration of at least one minute (whole seconds)."""
+    minutes, seconds = divmod(seconds, 60)
 
     if minutes < 60:
         if seconds > 0:
             return f"{minutes}m {seconds}s"
         return f"{minutes}m"
 
-    hours = minutes // 60
-    minutes = minutes % 60
+    hours, minutes = divmod(minutes, 60)
 
     if hours < 24:
         if minutes > 0:
             return f"{hours}h {minutes}m"
         return f"{hours}h"
 
-    days = hours // 24
-    hours = hours % 24
+    days, hours = divmod(hours, 24)
 
     if hours > 0:
         return f"{days}d {hours}h"
@@ -459,9 +648,7 @@ def format_duration(seconds: float | None) -> str:
 
 def format_short_id(full_id: str) -> str:
     """Return first 8 chars of a UUID for display."""
-    if not full_id:
-        return "?"
-    return full_id[:8]
+    return full_id[:8] if full_id else "?"
 
 
 def format_timestamp(dt: datetime | None) -> str:
@@ -469,61 +656,126 @@ def format_timestamp(dt: datetime | None) -> str:
     if dt is None:
         return "-"
 
-    # Format as ISO-like but more readable
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Format as ISO-like but more readable. Built from the fields directly:
+    # same output as strftime("%Y-%m-%d %H:%M:%S") in the datetime's own
+    # zone, without going through the C strftime machinery.
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
+def _ssh_detail(machine: Any) -> str:
+    parts = []
+    if machine.user and machine.host:
+        parts.append(f"{machine.user}@{machine.host}")
+    if machine.port and machine.port != 22:
+        parts.append(f"port {machine.port}")
+    if machine.key_file:
+        parts.append(f"key: {machine.key_file}")
+    return ", ".join(parts) if parts else "ssh"
+
+
+def _docker_detail(machine: Any) -> str:
+    parts = [f"image: {machine.image}"]
+    if machine.volumes:
+        parts.append(f"volumes: {len(machine.volumes)}")
+    return ", ".join(parts)
+
+
+# Per-transport formatters: one dict lookup per row instead of an if/elif chain.
+_MACHINE_LABELS: dict[TransportType, Any] = {
+    TransportType.LOCAL: lambda m: "localhost",
+    TransportType.SSH: lambda m: f"{m.user or '?'}@{m.host or '?'}",
+    TransportType.DOCKER: lambda m: f"docker:{m.image or '?'}",
+    TransportType.WEBSOCKET: lambda m: f"ws://{m.host or '?'}:{m.agent_port or '?'}",
+    TransportType.OPENCLAW: lambda m: f"oc://{m.host or '?'}",
+}
+
+_MACHINE_DETAILS: dict[TransportType, Any] = {
+    TransportType.LOCAL: lambda m: "localhost",
+    TransportType.SSH: _ssh_detail,
+    TransportType.DOCKER: _docker_detail,
+    TransportType.WEBSOCKET: lambda m: f"ws://{m.host}:{m.agent_port}",
+    TransportType.OPENCLAW: lambda m: f"openclaw://{m.host}",
+}
 
 
 def format_machine_label(machine: Any) -> str:
     """Format machine config as a short label for table display."""
-    if machine.type == TransportType.LOCAL:
-        return "localhost"
-    elif machine.type == TransportType.SSH:
-        host = machine.host or "?"
-        user = machine.user or "?"
-        return f"{user}@{host}"
-    elif machine.type == TransportType.DOCKER:
-        image = machine.image or "?"
-        return f"docker:{image}"
-    elif machine.type == TransportType.WEBSOCKET:
-        host = machine.host or "?"
-        port = machine.agent_port or "?"
-        return f"ws://{host}:{port}"
-    elif machine.type == TransportType.OPENCLAW:
-        host = machine.host or "?"
-        return f"oc://{host}"
-    else:
-        return "unknown"
+    formatter = _MACHINE_LABELS.get(machine.type)
+    return formatter(machine) if formatter is not None else "unknown"
 
 
 def format_machine_detail(machine: Any) -> str:
     """Format machine config as detailed string."""
-    if machine.type == TransportType.LOCAL:
-        return "localhost"
-    elif machine.type == TransportType.SSH:
-        parts = []
-        if machine.user and machine.host:
-            parts.append(f"{machine.user}@{machine.host}")
-        if machine.port and machine.port != 22:
-            parts.append(f"port {machine.port}")
-        if machine.key_file:
-            parts.append(f"key: {machine.key_file}")
-        return ", ".join(parts) if parts else "ssh"
-    elif machine.type == TransportType.DOCKER:
-        parts = [f"image: {machine.image}"]
-        if machine.volumes:
-            parts.append(f"volumes: {len(machine.volumes)}")
-        return ", ".join(parts)
-    elif machine.type == TransportType.WEBSOCKET:
-        return f"ws://{machine.host}:{machine.agent_port}"
-    elif machine.type == TransportType.OPENCLAW:
-        return f"openclaw://{machine.host}"
-    else:
-        return "unknown transport"
+    formatter = _MACHINE_DETAILS.get(machine.type)
+    return formatter(machine) if formatter is not None else "unknown transport"
+
+
+def _dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize *data* as JSON, using orjson when it is installed.
+
+    Output is indented by two spaces unless ``indent`` is false, in which
+    case it is a single compact line. Datetimes are passed through to
+    ``default=str`` so the output matches the stdlib path; anything orjson
+    rejects falls back to ``json``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=_ORJSON_OPTIONS if indent else _ORJSON_LINE_OPTIONS,
+                default=str,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    if indent:
+        return json.dumps(data, indent=2, default=str).encode()
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
 
 
 def print_json(data: Any) -> None:
     """Print any data as formatted JSON."""
-    print(json.dumps(data, indent=2, default=str))
+    print_json_raw(_dumps_json(data))
+
+
+def print_json_raw(raw: str | bytes) -> None:
+    """Print an already-serialized JSON document (e.g. from ``model_dump_json``).
+
+    Bytes go straight to the binary stdout buffer in a single write.
+    """
+    if isinstance(raw, str):
+        print(raw)
+        return
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(raw.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(raw + b"\n")
+    buffer.flush()
+
+
+def print_ndjson(items: Iterable[Any]) -> None:
+    """Print *items* as newline-delimited JSON, one compact object per line.
+
+    Each item is serialized and written on its own, so nothing larger than
+    one line is ever held in memory and *items* may be a lazy iterable.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    sys.stdout.flush()
+    for item in items:
+        if isinstance(item, BaseModel):
+            line = item.model_dump_json(fallback=str).encode()
+        else:
+            line = _dumps_json(item, indent=False)
+        if buffer is None:
+            print(line.decode())
+        else:
+            buffer.write(line + b"\n")
+    if buffer is not None:
+        buffer.flush()
 
 
 # --- Progress and streaming helpers ---
@@ -537,7 +789,7 @@ def create_progress_bar(description: str = "Processing") -> Any:
         TextColumn("[bold blue]{task.description}"),
         BarColumn(),
         TimeElapsedColumn(),
-        console=console,
+        console=console._get(),
     )
 
 
@@ -549,8 +801,20 @@ def print_streaming_output(line: str, prefix: str = "") -> None:
         console.print(line, markup=False, highlight=False)
 
 
+# Rendered separator lines (including ANSI styling), keyed by
+# (char, style, terminal width).
+_SEPARATOR_CACHE: dict[tuple[str, str, int], str] = {}
+
+
 def print_separator(char: str = "─", style: str = "dim") -> None:
     """Print a horizontal separator line."""
-    if not _json_mode:
-        width = console.width
-        console.print(char * width, style=style)
+    if _json_mode:
+        return
+    width = console.width
+    key = (char, style, width)
+    line = _SEPARATOR_CACHE.get(key)
+    if line is None:
+        with console.capture() as capture:
+            console.print(char * width, style=style)
+        line = _SEPARATOR_CACHE[key] = capture.get()
+    console.file.write(line)
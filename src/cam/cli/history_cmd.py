@@ -2,18 +2,39 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import typer
 
 from cam.cli.formatters import (
+    build_table,
     console,
     format_duration,
     format_short_id,
+    format_status,
     is_json_mode,
+    is_ndjson_mode,
     print_error,
     print_info,
     print_json,
+    print_ndjson,
+)
+from cam.core.models import AgentStatus
+from cam.storage.history_store import HistoryStore
+
+# History rows carry the raw status string; map it back to the enum so the
+# cell can reuse formatters' prebuilt (already styled) Text.
+_STATUS_BY_VALUE = {s.value: s for s in AgentStatus}
+
+_HISTORY_COLUMNS = (
+    ("ID", {"style": "dim", "no_wrap": True}),
+    ("Tool", {"style": "bold"}),
+    ("Status", {"no_wrap": True}),
+    ("Context", {"style": "cyan"}),
+    ("Duration", {"justify": "right"}),
+    ("Task", {"max_width": 40, "no_wrap": True, "overflow": "ellipsis"}),
+    ("Reason", {"style": "dim", "max_width": 25}),
 )
 
 
@@ -31,11 +52,8 @@ def history(
         cam history --ctx my-project --last 7d
         cam history --tool claude --status failed
     """
-    from datetime import datetime, timedelta, timezone
-
     from cam.cli.app import state
     from cam.core.config import parse_duration
-    from cam.storage.history_store import HistoryStore
 
     # Parse time window
     since = None
@@ -57,36 +75,19 @@ def history(
         print_info("No history found matching the filters.")
         return
 
+    if is_ndjson_mode():
+        print_ndjson(entries)
+        return
     if is_json_mode():
         print_json(entries)
         return
 
-    from rich.table import Table
-
-    table = Table(title="Agent History", title_style="bold yellow")
-    table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Tool", style="bold")
-    table.add_column("Status", no_wrap=True)
-    table.add_column("Context", style="cyan")
-    table.add_column("Duration", justify="right")
-    table.add_column("Task", max_width=40)
-    table.add_column("Reason", style="dim", max_width=25)
+    table = build_table("Agent History", "bold yellow", _HISTORY_COLUMNS)
 
     for entry in entries:
         status_val = entry["status"]
-        if status_val == "completed":
-            status_display = "[green]✓ completed[/green]"
-        elif status_val == "failed":
-            status_display = "[red]✗ failed[/red]"
-        elif status_val == "timeout":
-            status_display = "[red]⏱ timeout[/red]"
-        elif status_val == "killed":
-            status_display = "[red]☠ killed[/red]"
-        else:
-            status_display = status_val
-
-        prompt = entry.get("prompt", "")
-        prompt_preview = prompt[:37] + "..." if len(prompt) > 40 else prompt
+        status_member = _STATUS_BY_VALUE.get(status_val)
+        status_display = format_status(status_member) if status_member is not None else status_val
 
         table.add_row(
             format_short_id(entry["id"]),
@@ -94,7 +95,7 @@ def history(
             status_display,
             entry.get("context", ""),
             format_duration(entry.get("duration")),
-            prompt_preview,
+            entry.get("prompt", ""),
             entry.get("exit_reason", "") or "",
         )
 
@@ -111,13 +112,10 @@ def stats(
         cam stats
         cam stats --ctx my-project --last 7d
     """
-    from datetime import datetime, timedelta, timezone
-
     from rich.panel import Panel
 
     from cam.cli.app import state
     from cam.core.config import parse_duration
-    from cam.storage.history_store import HistoryStore
 
     # Parse time window
     since = None
@@ -137,20 +135,16 @@ def stats(
         print_info("No agents found in the specified time window.")
         return
 
-    lines = []
-    lines.append(f"[bold]Total Agents:[/bold] {data['total']}")
-    lines.append("")
+    lines = [f"[bold]Total Agents:[/bold] {data['total']}", ""]
 
     # By status
     lines.append("[bold]By Status:[/bold]")
-    for s, count in sorted(data["by_status"].items()):
-        lines.append(f"  {s}: {count}")
+    lines.extend(f"  {s}: {count}" for s, count in sorted(data["by_status"].items()))
 
     # By tool
     lines.append("")
     lines.append("[bold]By Tool:[/bold]")
-    for t, count in sorted(data["by_tool"].items()):
-        lines.append(f"  {t}: {count}")
+    lines.extend(f"  {t}: {count}" for t, count in sorted(data["by_tool"].items()))
 
     # Metrics
     lines.append("")
@@ -111,63 +111,69 @@ def init() -> None:
 
     from cam.constants import CONFIG_DIR, DATA_DIR
 
-    console.print()
-    console.print("[bold cyan]CAM — Coding Agent Manager[/bold cyan]")
-    console.print(f"Version {__version__}")
-    console.print()
-
-    # Step 1: Check dependencies
-    console.print("[bold]Step 1: Checking dependencies...[/bold]")
+    # Each block below is emitted with one console.print so the wizard
+    # renders per step rather than per line.
+    console.print("\n".join([
+        "",
+        "[bold cyan]CAM — Coding Agent Manager[/bold cyan]",
+        f"Version {__version__}",
+        "",
+        "[bold]Step 1: Checking dependencies...[/bold]",
+    ]))
     from cam.utils.doctor import check_all
 
     checks = check_all()
     passed = sum(1 for c in checks if c.status)
     total = len(checks)
-    console.print(f"  {passed}/{total} checks passed")
+    lines = [f"  {passed}/{total} checks passed"]
 
     required_failed = [c for c in checks if c.required and not c.status]
     if required_failed:
-        for c in required_failed:
-            console.print(f"  [red]✗ {c.name}: {c.message}[/red]")
-        console.print()
-        console.print("[red]Required dependencies missing. Please install them and try again.[/red]")
+        lines.extend(f"  [red]✗ {c.name}: {c.message}[/red]" for c in required_failed)
+        lines.append("")
+        lines.append("[red]Required dependencies missing. Please install them and try again.[/red]")
+        console.print("\n".join(lines))
         raise typer.Exit(1)
 
-    console.print("  [green]All required dependencies available[/green]")
-    console.print()
+    lines.append("  [green]All required dependencies available[/green]")
+    lines.append("")
 
     # Step 2: Create directories
-    console.print("[bold]Step 2: Setting up directories...[/bold]")
+    lines.append("[bold]Step 2: Setting up directories...[/bold]")
+    console.print("\n".join(lines))
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     (DATA_DIR / "logs").mkdir(parents=True, exist_ok=True)
     (DATA_DIR / "sockets").mkdir(parents=True, exist_ok=True)
 
-    console.print(f"  Config: {CONFIG_DIR}")
-    console.print(f"  Data:   {DATA_DIR}")
-    console.print()
-
     # Step 3: Initialize database
-    console.print("[bold]Step 3: Initializing database...[/bold]")
+    console.print("\n".join([
+        f"  Config: {CONFIG_DIR}",
+        f"  Data:   {DATA_DIR}",
+        "",
+        "[bold]Step 3: Initializing database...[/bold]",
+    ]))
     from cam.cli.app import state
     _ = state.db  # Triggers DB creation and migration
-    console.print(f"  Database: {DATA_DIR / 'cam.db'}")
-    console.print()
 
     # Step 4: Available tools
-    console.print("[bold]Step 4: Detecting coding tools...[/bold]")
     import shutil
     tools = {
         "claude": shutil.which("claude"),
         "codex": shutil.which("codex"),
     }
+    lines = [
+        f"  Database: {DATA_DIR / 'cam.db'}",
+        "",
+        "[bold]Step 4: Detecting coding tools...[/bold]",
+    ]
     for tool_name, path in tools.items():
         if path:
-            console.print(f"  [green]✓[/green] {tool_name}: {path}")
+            lines.append(f"  [green]✓[/green] {tool_name}: {path}")
         else:
-            console.print(f"  [dim]✗ {tool_name}: not found[/dim]")
-
-    console.print()
+            lines.append(f"  [dim]✗ {tool_name}: not found[/dim]")
+    lines.append("")
+    console.print("\n".join(lines))
 
     # Step 5: Offer to add a context
     console.print("[bold]Step 5: Add a context?[/bold]")
@@ -195,12 +201,14 @@ def init() -> None:
 
     console.print()
     print_success("CAM setup complete!")
-    console.print()
-    console.print("[bold]Quick start:[/bold]")
-    console.print("  cam context list          # List your contexts")
-    console.print("  cam run claude \"task\"      # Run an agent")
-    console.print("  cam list                  # Check agent status")
-    console.print("  cam --help                # Full command reference")
+    console.print("\n".join([
+        "",
+        "[bold]Quick start:[/bold]",
+        "  cam context list          # List your contexts",
+        "  cam run claude \"task\"      # Run an agent",
+        "  cam list                  # Check agent status",
+        "  cam --help                # Full command reference",
+    ]))
 
 
 # ---------------------------------------------------------------------------
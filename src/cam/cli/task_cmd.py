@@ -5,6 +5,7 @@ Provides the `cam apply` command for declarative task execution from YAML files.
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import Optional
 
 import typer
@@ -13,6 +14,9 @@ from cam.cli.formatters import print_error, print_info, print_success, print_war
 
 app = typer.Typer(help="Task file operations", no_args_is_help=True)
 
+# Terminal statuses counted as failures in the apply summary
+_FAILED_STATUS_VALUES = frozenset(("failed", "timeout", "killed"))
+
 
 def apply(
     file: str = typer.Option(..., "--file", "-f", help="Path to task YAML file"),
@@ -30,10 +34,7 @@ def apply(
         cam apply -f tasks.yaml --ctx my-project
         cam apply -f tasks.yaml --dry-run
     """
-    import asyncio
-
-    from cam.cli.app import state
-    from cam.core.scheduler import SchedulerError, TaskGraph, Scheduler, load_task_file
+    from cam.core.scheduler import SchedulerError, TaskGraph, load_task_file
 
     # Load and parse task file
     try:
@@ -56,13 +57,14 @@ def apply(
     print_info(f"Tasks: {len(graph)} total, {len(levels)} execution levels")
     print_info("")
 
+    default_ctx_label = ctx or "(default)"
     for level_idx, level in enumerate(levels):
         level_label = f"Level {level_idx + 1}"
         task_details = []
         for task_name in level:
             task = graph.get_task(task_name)
             deps = f" (after: {', '.join(task.depends_on)})" if task.depends_on else ""
-            ctx_label = task.context or ctx or "(default)"
+            ctx_label = task.context or default_ctx_label
             task_details.append(f"  {task_name}: [{task.tool}] {task.prompt[:60]}{deps} -> {ctx_label}")
         print_info(f"{level_label}:")
         for detail in task_details:
@@ -73,26 +75,39 @@ def apply(
         print_success("Dry run complete — no tasks were executed")
         return
 
-    # Execute
+    # Execute (only this path needs the event loop and the agent manager)
+    import asyncio
+
+    from cam.cli.app import state
+    from cam.core.scheduler import Scheduler
+
     print_info("")
     print_info("Executing task graph...")
 
     scheduler = Scheduler(state.agent_manager, state.context_store)
 
+    async def _execute() -> dict:
+        # Python 3.12+: start tasks eagerly so the scheduler's many short
+        # coroutines that finish before their first await skip a loop hop.
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_factory)
+        return await scheduler.execute(graph, default_context=ctx, follow=not detach)
+
     try:
-        results = asyncio.run(
-            scheduler.execute(graph, default_context=ctx, follow=not detach)
-        )
+        results = asyncio.run(_execute())
 
         # Summary
         print_info("")
-        completed = sum(1 for a in results.values() if a.status.value == "completed")
-        failed = sum(1 for a in results.values() if a.status.value in ("failed", "timeout", "killed"))
-        running = sum(1 for a in results.values() if a.status.value == "running")
+        counts = Counter(a.status.value for a in results.values())
+        completed = counts["completed"]
+        failed = sum(counts[s] for s in _FAILED_STATUS_VALUES)
+        running = counts["running"]
 
         for task_name, agent in results.items():
-            status_icon = "✓" if agent.status.value == "completed" else "✗"
-            print_info(f"  {status_icon} {task_name}: {agent.status.value} [{str(agent.id)[:8]}]")
+            status_value = agent.status.value
+            status_icon = "✓" if status_value == "completed" else "✗"
+            print_info(f"  {status_icon} {task_name}: {status_value} [{str(agent.id)[:8]}]")
 
         print_info("")
         if failed > 0:
@@ -40,6 +40,10 @@ from cam.transport.factory import TransportFactory
 logger = logging.getLogger(__name__)
 _CONFIGS_DIR = Path(__file__).parent.parent / "adapters" / "configs"
 
+# Follow-mode camc polling: base interval and back-off ceiling (seconds)
+_FOLLOW_POLL_MIN = 3.0
+_FOLLOW_POLL_MAX = 12.0
+
 
 class AgentManagerError(Exception):
     """Error raised by AgentManager operations."""
@@ -83,6 +87,9 @@ class AgentManager:
         # Track background monitor tasks so they can be awaited/cancelled
         self._monitor_tasks: dict[str, asyncio.Task] = {}
 
+        # Transports are reusable; keep one per distinct machine config
+        self._transports: dict[str, Transport] = {}
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -145,12 +152,12 @@ class AgentManager:
         agent.context_path = context.path
         agent.transport_type = context.machine.type
 
-        # Persist to cam's SQLite
-        self._agent_store.save(agent)
+        # Persist to cam's SQLite (in a thread: sqlite blocks the event loop)
+        await asyncio.to_thread(self._agent_store.save, agent)
 
         # Update context last-used timestamp
         try:
-            self._context_store.update_last_used(str(context.id))
+            await asyncio.to_thread(self._context_store.update_last_used, context.id)
         except Exception:
             pass
 
@@ -162,7 +169,7 @@ class AgentManager:
                     "via": "camc"},
         )
         try:
-            self._agent_store.add_event(started_event)
+            await asyncio.to_thread(self._agent_store.add_event, started_event)
         except Exception:
             pass
         self._event_bus.publish(started_event)
@@ -188,7 +195,7 @@ class AgentManager:
         Raises:
             AgentManagerError: If agent is not found or not in a running state.
         """
-        agent = self._agent_store.get(agent_id)
+        agent = await asyncio.to_thread(self._agent_store.get, agent_id)
         if agent is None:
             raise AgentManagerError(f"Agent '{agent_id}' not found")
 
@@ -207,7 +214,8 @@ class AgentManager:
             logger.warning("camc stop/kill failed for agent %s, updating local state anyway", agent.id)
 
         # Update local SQLite
-        self._agent_store.update_status(
+        await asyncio.to_thread(
+            self._agent_store.update_status,
             agent_id,
             AgentStatus.KILLED,
             exit_reason="Stopped by user" if graceful else "Force killed",
@@ -220,7 +228,7 @@ class AgentManager:
             detail={"graceful": graceful, "via": "camc"},
         )
         try:
-            self._agent_store.add_event(kill_event)
+            await asyncio.to_thread(self._agent_store.add_event, kill_event)
         except Exception:
             pass
         self._event_bus.publish(kill_event)
@@ -298,27 +306,40 @@ class AgentManager:
             List of agents that were marked as orphaned (FAILED).
         """
         orphaned: list[Agent] = []
-        running_agents = self._agent_store.list(status=AgentStatus.RUNNING)
+        running_agents = await asyncio.to_thread(
+            self._agent_store.list, status=AgentStatus.RUNNING
+        )
+        # Many agents share a context: look each one up once per pass.
+        contexts: dict[str, Context | None] = {}
+        now = datetime.now(timezone.utc)
+        # Status changes are committed together in one transaction at the end;
+        # orphan events are inserted afterwards, best-effort
+        status_updates: list[tuple[str, AgentStatus, str | None]] = []
+        orphan_events: list[AgentEvent] = []
 
         for agent in running_agents:
             if not agent.tmux_session:
-                self._agent_store.update_status(
-                    str(agent.id),
-                    AgentStatus.FAILED,
-                    exit_reason="No TMUX session ID recorded",
+                status_updates.append(
+                    (agent.id, AgentStatus.FAILED, "No TMUX session ID recorded")
                 )
                 orphaned.append(agent)
                 continue
 
             # Build transport for this agent's context
-            context = self._context_store.get(str(agent.context_id))
+            context_id = agent.context_id
+            if context_id in contexts:
+                context = contexts[context_id]
+            else:
+                context = contexts[context_id] = await asyncio.to_thread(
+                    self._context_store.get, context_id
+                )
             if context is None:
                 context = Context(
-                    id=str(agent.context_id),
+                    id=context_id,
                     name=agent.context_name or "cwd",
                     path=agent.context_path or "",
                     machine=MachineConfig(type=agent.transport_type or TransportType.LOCAL),
-                    created_at=datetime.now(timezone.utc),
+                    created_at=now,
                 )
                 if not context.path:
                     orphaned.append(agent)
@@ -337,26 +358,26 @@ class AgentManager:
                 has_worked = agent.state not in (AgentState.INITIALIZING, None)
                 final_status = AgentStatus.COMPLETED if has_worked else AgentStatus.FAILED
                 exit_reason = "Session ended cleanly" if has_worked else "TMUX session disappeared"
-                self._agent_store.update_status(
-                    str(agent.id),
-                    final_status,
-                    exit_reason=exit_reason,
-                )
+                status_updates.append((agent.id, final_status, exit_reason))
                 orphaned.append(agent)
-
-                orphan_event = AgentEvent(
+                orphan_events.append(AgentEvent(
                     agent_id=agent.id,
                     event_type="agent_orphaned",
                     detail={"session": agent.tmux_session},
-                )
+                ))
+
+                logger.warning("Agent %s orphaned: TMUX session %s disappeared", agent.id, agent.tmux_session)
+
+        if status_updates:
+            await asyncio.to_thread(self._agent_store.bulk_update_status, status_updates)
+            if orphan_events:
                 try:
-                    self._agent_store.add_event(orphan_event)
+                    await asyncio.to_thread(self._agent_store.add_events, orphan_events)
                 except Exception:
                     pass
+            for orphan_event in orphan_events:
                 self._event_bus.publish(orphan_event)
 
-                logger.warning("Agent %s orphaned: TMUX session %s disappeared", agent.id, agent.tmux_session)
-
         if orphaned:
             logger.info("Reconciliation found %d orphaned agent(s)", len(orphaned))
 
@@ -668,8 +689,14 @@ class AgentManager:
     # ------------------------------------------------------------------
 
     async def _follow_camc_agent(self, delegate, agent: Agent) -> None:
-        """Poll camc until agent reaches a terminal state (follow mode)."""
-        poll_interval = 3.0
+        """Poll camc until agent reaches a terminal state (follow mode).
+
+        Each poll is a camc round-trip (an SSH call for remote machines), so
+        the interval backs off while the agent's state stays the same and
+        drops back to the base interval as soon as it changes.
+        """
+        poll_interval = _FOLLOW_POLL_MIN
+        last_seen: tuple | None = None
         while True:
             await asyncio.sleep(poll_interval)
             data = await asyncio.to_thread(delegate.get_agent, agent.id)
@@ -700,6 +727,13 @@ class AgentManager:
                 self._event_bus.publish(done_event)
                 break
 
+            seen = (status, data.get("state"))
+            if seen == last_seen:
+                poll_interval = min(poll_interval * 2, _FOLLOW_POLL_MAX)
+            else:
+                poll_interval = _FOLLOW_POLL_MIN
+                last_seen = seen
+
             # Update state if changed
             state_str = data.get("state", "")
             if state_str:
@@ -713,8 +747,18 @@ class AgentManager:
     # ------------------------------------------------------------------
 
     def _create_transport(self, context: Context) -> Transport:
-        """Create a transport for the given context."""
-        return self._transport_factory_class.create(context.machine)
+        """Return a transport for the given context.
+
+        Transports are cached per machine configuration, so contexts on the
+        same machine share one instance.
+        """
+        key = context.machine.model_dump_json()
+        transport = self._transports.get(key)
+        if transport is None:
+            transport = self._transports[key] = self._transport_factory_class.create(
+                context.machine
+            )
+        return transport
 
     def _resolve_agent_delegate(self, agent_id: str):
         """Look up agent, its context, and create a CamcDelegate.
@@ -736,7 +780,7 @@ class AgentManager:
             # addressable by the local camc. Do not require a CAM context row.
             host = user = port = None
         elif not host:
-            context = self._context_store.get(str(agent.context_id))
+            context = self._context_store.get(agent.context_id)
             if context is None:
                 raise AgentManagerError("Agent's context not found")
             machine = context.machine
@@ -746,7 +790,7 @@ class AgentManager:
         delegate = CamcDelegate(host=host, user=user, port=port)
         # camc uses its own short IDs; pass the tmux session name which
         # camc can match, or fall back to the full agent ID.
-        camc_id = agent.tmux_session or str(agent.id)
+        camc_id = agent.tmux_session or agent.id
         return agent, camc_id, delegate
 
     async def capture_output(
@@ -370,7 +370,10 @@ class CamcPoller:
                     )
                     # Preserve cam-local fields that camc doesn't populate
                     agent_fresh.context_id = existing.context_id or agent_fresh.context_id
-                    self._agent_store.save(agent_fresh)
+                    # Most polls change nothing; an equal model would write
+                    # back the row it was just read from, so skip the UPSERT.
+                    if agent_fresh != existing:
+                        self._agent_store.save(agent_fresh)
 
                     # Emit event on status change
                     prev_status = self._prev_states.get(agent_id)
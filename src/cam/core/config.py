@@ -10,12 +10,9 @@ Loads configuration from multiple sources in priority order:
 
 from __future__ import annotations
 
+import json
 import os
 import re
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import tomli as tomllib  # type: ignore[no-redef]
 from pathlib import Path
 from typing import Any
 
@@ -119,6 +116,10 @@ class CamConfig(BaseModel):
     tools: dict[str, ToolConfig] = Field(default_factory=dict)
 
 
+_DURATION_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhd])$")
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
 def parse_duration(s: str | None) -> int | None:
     """Parse duration string into seconds.
 
@@ -154,8 +155,14 @@ def parse_duration(s: str | None) -> int | None:
     if s.isdigit():
         return int(s)
 
+    # Simple "<int><unit>" needs no regex
+    lowered = s.lower()
+    head, unit = lowered[:-1], lowered[-1]
+    if unit in _DURATION_UNITS and head.isdigit():
+        return int(head) * _DURATION_UNITS[unit]
+
     # Parse with unit
-    match = re.match(r"^(\d+(?:\.\d+)?)\s*([smhd])$", s.lower())
+    match = _DURATION_RE.match(lowered)
     if not match:
         raise ValueError(
             f"Invalid duration format: {s}. "
@@ -163,33 +170,48 @@ def parse_duration(s: str | None) -> int | None:
         )
 
     value, unit = match.groups()
-    value = float(value)
-
-    units = {
-        "s": 1,
-        "m": 60,
-        "h": 3600,
-        "d": 86400,
-    }
-
-    return int(value * units[unit])
+    return int(float(value) * _DURATION_UNITS[unit])
 
 
 def _find_project_config() -> Path | None:
     """Walk up from CWD looking for .cam/config.toml.
 
+    Not cached: a config can appear in any directory on the path, and
+    checking for that costs as much as the walk itself.
+
     Returns:
         Path to project config file if found, None otherwise
     """
-    current = Path.cwd()
+    current = os.getcwd()
+    while True:
+        config_path = os.path.join(current, PROJECT_CONFIG)
+        try:
+            os.stat(config_path)
+        except OSError:
+            pass
+        else:
+            return Path(config_path)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
 
-    # Walk up the directory tree
-    for parent in [current, *current.parents]:
-        config_path = parent / PROJECT_CONFIG
-        if config_path.exists():
-            return config_path
+def read_toml(path: str | Path) -> dict:
+    """Parse a TOML file, raising on a missing file or invalid TOML.
 
-    return None
+    The one place CAM picks its TOML parser for config files.
+    """
+    # Imported here so importing this module doesn't pay for the TOML parser.
+    try:
+        # Prefer tomli when installed: its wheels are mypyc-compiled, while
+        # the stdlib tomllib is the same parser in pure Python.
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        import tomllib  # type: ignore[no-redef]
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
 
 def _load_toml(path: Path) -> dict:
@@ -205,9 +227,8 @@ def _load_toml(path: Path) -> dict:
         return {}
 
     try:
-        with open(path, "rb") as f:
-            return tomllib.load(f)
-    except (OSError, tomllib.TOMLDecodeError) as e:
+        return read_toml(path)
+    except (OSError, ValueError) as e:  # TOMLDecodeError is a ValueError
         # Log warning but don't fail - just skip this config source
         print(f"Warning: Failed to load {path}: {e}")
         return {}
@@ -224,19 +245,79 @@ def _merge_dicts(base: dict, override: dict) -> dict:
         Merged dictionary (creates a new dict)
     """
     result = base.copy()
-
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # Recursively merge nested dicts
-            result[key] = _merge_dicts(result[key], value)
-        else:
-            # Override scalar values or lists
-            result[key] = value
+    # Nested dicts are copied only along the paths the override touches.
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                # Override scalar values or lists
+                target[key] = value
 
     return result
 
 
-def _apply_env_vars(config: dict) -> dict:
+def _env_bool(value: str) -> bool:
+    """Interpret an environment variable as a boolean flag."""
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+# (env var, section, key, converter)
+_ENV_MAPPINGS: tuple[tuple[str, str, str, Any], ...] = (
+    # General settings
+    ("CAM_DEFAULT_TOOL", "general", "default_tool", str),
+    ("CAM_DEFAULT_TIMEOUT", "general", "default_timeout", str),
+    ("CAM_AUTO_CONFIRM", "general", "auto_confirm", _env_bool),
+    ("CAM_LOG_LEVEL", "general", "log_level", str),
+    # Monitor settings
+    ("CAM_POLL_INTERVAL", "monitor", "poll_interval", int),
+    ("CAM_IDLE_TIMEOUT", "monitor", "idle_timeout", int),
+    ("CAM_HEALTH_CHECK_INTERVAL", "monitor", "health_check_interval", int),
+    ("CAM_PROBE_DETECTION", "monitor", "probe_detection", _env_bool),
+    ("CAM_PROBE_STABLE_SECONDS", "monitor", "probe_stable_seconds", int),
+    ("CAM_PROBE_COOLDOWN", "monitor", "probe_cooldown", int),
+    # Retry settings
+    ("CAM_MAX_RETRIES", "retry", "max_retries", int),
+    ("CAM_BACKOFF_BASE", "retry", "backoff_base", float),
+    ("CAM_BACKOFF_MAX", "retry", "backoff_max", float),
+    # Display settings
+    ("CAM_COLOR", "display", "color", _env_bool),
+    ("CAM_UNICODE", "display", "unicode", _env_bool),
+    ("CAM_COMPACT", "display", "compact", _env_bool),
+    # Security settings
+    ("CAM_ENCRYPT_TOKENS", "security", "encrypt_tokens", _env_bool),
+    ("CAM_SANDBOX", "security", "sandbox", _env_bool),
+    # Path settings
+    ("CAM_DATA_DIR", "paths", "data_dir", str),
+    ("CAM_LOG_DIR", "paths", "log_dir", str),
+    # Server settings
+    ("CAM_SERVER_HOST", "server", "host", str),
+    ("CAM_SERVER_PORT", "server", "port", int),
+    ("CAM_SERVER_AUTH_TOKEN", "server", "auth_token", str),
+    ("CAM_SERVER_LOG_LEVEL", "server", "log_level", str),
+    ("CAM_RELAY_URL", "server", "relay_url", str),
+    ("CAM_RELAY_TOKEN", "server", "relay_token", str),
+)
+
+
+def _cam_environ() -> dict[str, str]:
+    """Snapshot the CAM_* environment variables in one pass over os.environ.
+
+    Every ``os.environ`` access encodes/decodes through its mapping layer,
+    so reading it once and working on a plain dict is much cheaper than
+    probing it per mapping.
+    """
+    environ = os.environ
+    # Iterating keys and indexing the few matches avoids decoding every value.
+    return {name: environ[name] for name in environ if name.startswith("CAM_")}
+
+
+def _apply_env_vars(config: dict, environ: dict[str, str] | None = None) -> dict:
     """Apply CAM_* environment variables to config.
 
     Environment variables use the format:
@@ -245,70 +326,43 @@ def _apply_env_vars(config: dict) -> dict:
 
     Args:
         config: Configuration dictionary
+        environ: CAM_* variables from :func:`_cam_environ`; taken from the
+            process environment when omitted.
 
     Returns:
         Updated configuration dictionary
     """
+    if environ is None:
+        environ = _cam_environ()
+    if not environ:
+        return config
+
     result = config.copy()
 
-    # Mapping of env var patterns to config paths
-    env_mappings = {
-        # General settings
-        "CAM_DEFAULT_TOOL": ("general", "default_tool"),
-        "CAM_DEFAULT_TIMEOUT": ("general", "default_timeout"),
-        "CAM_AUTO_CONFIRM": ("general", "auto_confirm"),
-        "CAM_LOG_LEVEL": ("general", "log_level"),
-        # Monitor settings
-        "CAM_POLL_INTERVAL": ("monitor", "poll_interval"),
-        "CAM_IDLE_TIMEOUT": ("monitor", "idle_timeout"),
-        "CAM_HEALTH_CHECK_INTERVAL": ("monitor", "health_check_interval"),
-        "CAM_PROBE_DETECTION": ("monitor", "probe_detection"),
-        "CAM_PROBE_STABLE_SECONDS": ("monitor", "probe_stable_seconds"),
-        "CAM_PROBE_COOLDOWN": ("monitor", "probe_cooldown"),
-        # Retry settings
-        "CAM_MAX_RETRIES": ("retry", "max_retries"),
-        "CAM_BACKOFF_BASE": ("retry", "backoff_base"),
-        "CAM_BACKOFF_MAX": ("retry", "backoff_max"),
-        # Display settings
-        "CAM_COLOR": ("display", "color"),
-        "CAM_UNICODE": ("display", "unicode"),
-        "CAM_COMPACT": ("display", "compact"),
-        # Security settings
-        "CAM_ENCRYPT_TOKENS": ("security", "encrypt_tokens"),
-        "CAM_SANDBOX": ("security", "sandbox"),
-        # Path settings
-        "CAM_DATA_DIR": ("paths", "data_dir"),
-        "CAM_LOG_DIR": ("paths", "log_dir"),
-        # Server settings
-        "CAM_SERVER_HOST": ("server", "host"),
-        "CAM_SERVER_PORT": ("server", "port"),
-        "CAM_SERVER_AUTH_TOKEN": ("server", "auth_token"),
-        "CAM_SERVER_LOG_LEVEL": ("server", "log_level"),
-        "CAM_RELAY_URL": ("server", "relay_url"),
-        "CAM_RELAY_TOKEN": ("server", "relay_token"),
-    }
-
-    for env_var, (section, key) in env_mappings.items():
-        value = os.environ.get(env_var)
+    for env_var, section, key, convert in _ENV_MAPPINGS:
+        value = environ.get(env_var)
         if value is not None:
             # Ensure section exists
             if section not in result:
                 result[section] = {}
+            result[section][key] = convert(value)
 
-            # Parse value based on type
-            if key in ("auto_confirm", "color", "unicode", "compact", "encrypt_tokens", "sandbox", "probe_detection"):
-                # Boolean values
-                value = value.lower() in ("true", "1", "yes", "on")
-            elif key in ("poll_interval", "idle_timeout", "health_check_interval", "max_retries", "probe_stable_seconds", "probe_cooldown", "port"):
-                # Integer values
-                value = int(value)
-            elif key in ("backoff_base", "backoff_max"):
-                # Float values
-                value = float(value)
+    return result
 
-            result[section][key] = value
 
-    return result
+# Results of load_config(), keyed by the state of every source it reads.
+_config_cache: dict[tuple, CamConfig] = {}
+_CONFIG_CACHE_MAX = 8
+
+
+def _mtime_ns(path: Path | None) -> int | None:
+    """Return the mtime of *path* in nanoseconds, or None if it is missing."""
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def load_config(**cli_overrides: Any) -> CamConfig:
@@ -325,14 +379,44 @@ def load_config(**cli_overrides: Any) -> CamConfig:
         **cli_overrides: Configuration overrides from CLI
             Can use flat keys like log_level="debug" or nested dicts
 
+    The merged result is cached and reused while the config files' mtimes,
+    the CAM_* environment and the overrides are unchanged.
+
     Returns:
-        Validated CamConfig instance
+        Validated CamConfig instance (a fresh copy; callers may mutate it)
 
     Examples:
         >>> config = load_config()
         >>> config = load_config(log_level="debug")
         >>> config = load_config(general={"log_level": "debug"})
     """
+    project_config_path = _find_project_config()
+    cam_environ = _cam_environ()
+    cache_key = (
+        str(GLOBAL_CONFIG),
+        _mtime_ns(GLOBAL_CONFIG),
+        str(project_config_path),
+        _mtime_ns(project_config_path),
+        tuple(sorted(cam_environ.items())),
+        json.dumps(cli_overrides, sort_keys=True, default=str),
+    )
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
+    config = _build_config(project_config_path, cam_environ, cli_overrides)
+    if len(_config_cache) >= _CONFIG_CACHE_MAX:
+        _config_cache.clear()
+    _config_cache[cache_key] = config
+    return config.model_copy(deep=True)
+
+
+def _build_config(
+    project_config_path: Path | None,
+    cam_environ: dict[str, str],
+    cli_overrides: dict[str, Any],
+) -> CamConfig:
+    """Merge all configuration sources into a validated CamConfig."""
     # Start with empty dict (Pydantic defaults will fill in)
     config_dict: dict[str, Any] = {}
 
@@ -344,14 +428,13 @@ def load_config(**cli_overrides: Any) -> CamConfig:
         config_dict = _merge_dicts(config_dict, global_config)
 
     # 3. Load project config
-    project_config_path = _find_project_config()
     if project_config_path:
         project_config = _load_toml(project_config_path)
         if project_config:
             config_dict = _merge_dicts(config_dict, project_config)
 
     # 4. Apply environment variables
-    config_dict = _apply_env_vars(config_dict)
+    config_dict = _apply_env_vars(config_dict, cam_environ)
 
     # 5. Apply CLI overrides
     if cli_overrides:
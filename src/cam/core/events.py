@@ -6,7 +6,6 @@ between components. All events are AgentEvent instances from the core models.
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Callable
 
 from cam.core.models import AgentEvent
@@ -30,7 +29,11 @@ class EventBus:
 
     def __init__(self) -> None:
         """Initialize the event bus with empty handler registry."""
-        self._handlers: dict[str, list[Callable]] = defaultdict(list)
+        self._handlers: dict[str, list[Callable]] = {}
+        self._has_wildcard = False
+        # event_type -> specific handlers followed by wildcard handlers;
+        # filled lazily by publish() and dropped on every (un)subscribe.
+        self._dispatch: dict[str, tuple[Callable, ...]] = {}
 
     def subscribe(self, event_type: str, handler: Callable[[AgentEvent], None]) -> None:
         """Subscribe to events of a specific type.
@@ -40,7 +43,10 @@ class EventBus:
             handler: Callable that accepts an AgentEvent. Must not raise
                      exceptions that should propagate to the publisher.
         """
-        self._handlers[event_type].append(handler)
+        self._handlers.setdefault(event_type, []).append(handler)
+        if event_type == "*":
+            self._has_wildcard = True
+        self._dispatch.clear()
 
     def unsubscribe(self, event_type: str, handler: Callable) -> None:
         """Remove a handler from an event type.
@@ -50,9 +56,16 @@ class EventBus:
             handler: The exact handler function/callable to remove.
                      Uses identity comparison (``is``), not equality.
         """
-        self._handlers[event_type] = [
-            h for h in self._handlers[event_type] if h is not handler
-        ]
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return
+        remaining = [h for h in handlers if h is not handler]
+        if remaining:
+            self._handlers[event_type] = remaining
+        else:
+            del self._handlers[event_type]
+        self._has_wildcard = "*" in self._handlers
+        self._dispatch.clear()
 
     def publish(self, event: AgentEvent) -> None:
         """Publish an event to all subscribers.
@@ -66,16 +79,15 @@ class EventBus:
         Args:
             event: The AgentEvent to publish.
         """
-        # Dispatch to specific event type handlers
-        for handler in self._handlers.get(event.event_type, []):
+        handlers = self._dispatch.get(event.event_type)
+        if handlers is None:
+            handlers = tuple(self._handlers.get(event.event_type, ()))
+            if self._has_wildcard:
+                handlers += tuple(self._handlers["*"])
+            self._dispatch[event.event_type] = handlers
+
+        for handler in handlers:
             try:
                 handler(event)
             except Exception:
                 pass  # Don't let handler errors break the publisher
-
-        # Dispatch to wildcard handlers
-        for handler in self._handlers.get("*", []):
-            try:
-                handler(event)
-            except Exception:
-                pass
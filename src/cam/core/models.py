@@ -7,7 +7,7 @@ All models support JSON serialization and include proper validation.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 from uuid import UUID, uuid4
@@ -28,6 +28,23 @@ class AgentStatus(str, Enum):
     RETRYING = "retrying"
 
 
+_TERMINAL_STATUSES = frozenset({
+    AgentStatus.COMPLETED,
+    AgentStatus.FAILED,
+    AgentStatus.TIMEOUT,
+    AgentStatus.KILLED,
+})
+_ACTIVE_STATUSES = frozenset({
+    AgentStatus.STARTING,
+    AgentStatus.RUNNING,
+    AgentStatus.RETRYING,
+})
+
+
+# Upper bound on the in-memory event log kept by Agent.add_event
+_MAX_INLINE_EVENTS = 1000
+
+
 class AgentState(str, Enum):
     """Agent internal state during execution."""
 
@@ -51,6 +68,17 @@ class TransportType(str, Enum):
     OPENCLAW = "openclaw"
 
 
+# Fields each transport type needs, checked in order.
+_REQUIRED_MACHINE_FIELDS: dict[TransportType, tuple[str, ...]] = {
+    TransportType.SSH: ("host", "user"),
+    TransportType.AGENT: ("host",),
+    TransportType.CLIENT: ("host",),
+    TransportType.DOCKER: ("image",),
+    TransportType.WEBSOCKET: ("host", "agent_port"),
+    TransportType.OPENCLAW: ("host",),
+}
+
+
 class MachineConfig(BaseModel):
     """Configuration for remote machine connections."""
 
@@ -91,28 +119,9 @@ class MachineConfig(BaseModel):
     @model_validator(mode="after")
     def validate_transport_config(self) -> MachineConfig:
         """Validate required fields based on transport type."""
-        if self.type == TransportType.SSH:
-            if not self.host:
-                raise ValueError("SSH transport requires 'host'")
-            if not self.user:
-                raise ValueError("SSH transport requires 'user'")
-        elif self.type == TransportType.AGENT:
-            if not self.host:
-                raise ValueError("AGENT transport requires 'host'")
-        elif self.type == TransportType.CLIENT:
-            if not self.host:
-                raise ValueError("CLIENT transport requires 'host'")
-        elif self.type == TransportType.DOCKER:
-            if not self.image:
-                raise ValueError("DOCKER transport requires 'image'")
-        elif self.type == TransportType.WEBSOCKET:
-            if not self.host:
-                raise ValueError("WEBSOCKET transport requires 'host'")
-            if not self.agent_port:
-                raise ValueError("WEBSOCKET transport requires 'agent_port'")
-        elif self.type == TransportType.OPENCLAW:
-            if not self.host:
-                raise ValueError("OPENCLAW transport requires 'host'")
+        for field in _REQUIRED_MACHINE_FIELDS.get(self.type, ()):
+            if not getattr(self, field):
+                raise ValueError(f"{self.type.name} transport requires '{field}'")
 
         return self
 
@@ -306,20 +315,33 @@ class Agent(BaseModel):
         return v
 
     def add_event(self, event_type: str, detail: dict[str, Any] | None = None) -> None:
-        """Add an event to the agent's event log."""
-        self.events.append({
+        """Add an event to the agent's event log.
+
+        Only the most recent ``_MAX_INLINE_EVENTS`` entries are kept on the
+        model; the full history lives in the ``agent_events`` table.
+        """
+        events = self.events
+        events.append({
             "agent_id": self.id,
             "timestamp": datetime.utcnow().isoformat(),
             "event_type": event_type,
             "detail": detail or {},
         })
+        if len(events) > _MAX_INLINE_EVENTS:
+            del events[:-_MAX_INLINE_EVENTS]
+
+    def duration_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Calculate execution duration in seconds.
 
-    def duration_seconds(self) -> Optional[float]:
-        """Calculate execution duration in seconds."""
+        Args:
+            now: End time to use for agents that have not completed. Callers
+                rendering many agents pass one shared value; defaults to the
+                current UTC time.
+        """
         if not self.started_at:
             return None
 
-        end_time = self.completed_at or datetime.utcnow()
+        end_time = self.completed_at or now or datetime.now(timezone.utc)
 
         # Normalize: strip tzinfo from both to avoid mixed naive/aware errors.
         # All datetimes in CAM are UTC, but some paths write aware (+00:00)
@@ -330,17 +352,8 @@ class Agent(BaseModel):
 
     def is_terminal(self) -> bool:
         """Check if agent is in a terminal state."""
-        return self.status in {
-            AgentStatus.COMPLETED,
-            AgentStatus.FAILED,
-            AgentStatus.TIMEOUT,
-            AgentStatus.KILLED
-        }
+        return self.status in _TERMINAL_STATUSES
 
     def is_active(self) -> bool:
         """Check if agent is actively running."""
-        return self.status in {
-            AgentStatus.STARTING,
-            AgentStatus.RUNNING,
-            AgentStatus.RETRYING
-        }
+        return self.status in _ACTIVE_STATUSES
@@ -82,10 +82,13 @@ class TaskGraph:
         Returns:
             List of levels, each level is a list of task names.
         """
-        # Compute in-degrees
+        # Compute in-degrees and the reverse edges (dep -> tasks needing it)
         in_degree: dict[str, int] = {name: 0 for name in self._tasks}
+        dependents: dict[str, list[str]] = defaultdict(list)
         for task_name, deps in self._edges.items():
             in_degree[task_name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(task_name)
 
         # Kahn's algorithm with level tracking
         levels: list[list[str]] = []
@@ -95,12 +98,10 @@ class TaskGraph:
             levels.append(sorted(ready))  # Sort for deterministic ordering
             next_ready: list[str] = []
             for completed_name in ready:
-                # Find tasks that depend on this one
-                for task_name, deps in self._edges.items():
-                    if completed_name in deps:
-                        in_degree[task_name] -= 1
-                        if in_degree[task_name] == 0:
-                            next_ready.append(task_name)
+                for task_name in dependents.get(completed_name, ()):
+                    in_degree[task_name] -= 1
+                    if in_degree[task_name] == 0:
+                        next_ready.append(task_name)
             ready = next_ready
 
         return levels
@@ -150,6 +151,8 @@ class Scheduler:
         """
         results: dict[str, Agent] = {}
         levels = graph.execution_order()
+        # Tasks usually share a handful of contexts; look each one up once.
+        contexts: dict[str, Any] = {}
 
         for level_idx, level in enumerate(levels):
             logger.info(
@@ -178,7 +181,9 @@ class Scheduler:
                         f"Task '{task_name}' has no context and no default context specified"
                     )
 
-                context = self._context_store.get(ctx_name)
+                context = contexts.get(ctx_name)
+                if context is None:
+                    context = contexts[ctx_name] = self._context_store.get(ctx_name)
                 if not context:
                     raise SchedulerError(
                         f"Context '{ctx_name}' not found for task '{task_name}'"
@@ -237,9 +242,12 @@ def load_task_file(path: str) -> tuple[list[TaskDefinition], dict[str, Any]]:
     if not file_path.exists():
         raise SchedulerError(f"Task file not found: {path}")
 
+    # Prefer the libyaml-backed loader when PyYAML was built with it. The file
+    # is handed over as bytes so the C scanner does its own decoding.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with open(file_path) as f:
-            data = yaml.safe_load(f)
+        with open(file_path, "rb") as f:
+            data = yaml.load(f, Loader=loader)
     except yaml.YAMLError as e:
         raise SchedulerError(f"Invalid YAML in {path}: {e}")
 
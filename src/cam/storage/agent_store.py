@@ -4,14 +4,39 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 from cam.core.models import Agent, AgentEvent, AgentState, AgentStatus, TransportType
+from cam.storage.database import DatabaseError
 
 if TYPE_CHECKING:
     from cam.storage.database import Database
 
 
+# Statuses that stamp completed_at when an agent moves into them
+_TERMINAL_STATUSES = (
+    AgentStatus.COMPLETED,
+    AgentStatus.FAILED,
+    AgentStatus.KILLED,
+    AgentStatus.TIMEOUT,
+)
+
+
+def _dump_detail(detail: dict[str, Any]) -> str:
+    """Serialize an event's detail dict for the ``detail`` column."""
+    if orjson is not None:
+        return orjson.dumps(detail, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(detail)
+
+
+_load_detail = orjson.loads if orjson is not None else json.loads
+
+
 class AgentStore:
     """Manages storage and retrieval of agents and their events."""
 
@@ -201,7 +226,7 @@ class AgentStore:
                 params.append(exit_reason)
 
             # Set completed_at if status is completed, failed, or cancelled
-            if status in (AgentStatus.COMPLETED, AgentStatus.FAILED, AgentStatus.KILLED, AgentStatus.TIMEOUT):
+            if status in _TERMINAL_STATUSES:
                 query += ", completed_at = datetime('now')"
 
             query += " WHERE id = ?"
@@ -213,6 +238,69 @@ class AgentStore:
         except sqlite3.Error as e:
             raise AgentStoreError(f"Failed to update agent status: {e}") from e
 
+    def bulk_update_status(
+        self,
+        updates: list[tuple[str, AgentStatus, str | None]],
+    ) -> None:
+        """Update the status of several agents in one transaction.
+
+        Unlike :meth:`update_status`, unknown agent IDs are skipped rather
+        than raising.
+
+        Args:
+            updates: ``(agent_id, status, exit_reason)`` tuples; an exit reason
+                of None leaves the stored one unchanged.
+
+        Raises:
+            AgentStoreError: If the batch fails; nothing is written in that case.
+        """
+        terminal = []
+        other = []
+        for agent_id, status, exit_reason in updates:
+            target = terminal if status in _TERMINAL_STATUSES else other
+            target.append((status.value, exit_reason, agent_id))
+        try:
+            with self.db.transaction():
+                if terminal:
+                    self.db.executemany(
+                        "UPDATE agents SET status = ?, exit_reason = COALESCE(?, exit_reason), "
+                        "completed_at = datetime('now') WHERE id = ?",
+                        terminal,
+                    )
+                if other:
+                    self.db.executemany(
+                        "UPDATE agents SET status = ?, exit_reason = COALESCE(?, exit_reason) "
+                        "WHERE id = ?",
+                        other,
+                    )
+        except (sqlite3.Error, DatabaseError) as e:
+            raise AgentStoreError(f"Failed to update agent statuses: {e}") from e
+
+    def add_events(self, events: list[AgentEvent]) -> None:
+        """Add several agent events with one ``executemany``.
+
+        Runs outside any transaction: rows inserted before a failure are kept.
+
+        Args:
+            events: Agent events to add.
+
+        Raises:
+            AgentStoreError: If an event cannot be added.
+        """
+        try:
+            self.db.executemany(
+                """
+                INSERT INTO agent_events (agent_id, timestamp, event_type, detail)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (e.agent_id, str(e.timestamp), e.event_type, _dump_detail(e.detail))
+                    for e in events
+                ],
+            )
+        except (sqlite3.Error, DatabaseError) as e:
+            raise AgentStoreError(f"Failed to add agent events: {e}") from e
+
     def add_event(self, event: AgentEvent) -> None:
         """Add an agent event.
 
@@ -232,7 +320,7 @@ class AgentStore:
                     event.agent_id,
                     str(event.timestamp),
                     event.event_type,
-                    json.dumps(event.detail),
+                    _dump_detail(event.detail),
                 ),
             )
         except sqlite3.Error as e:
@@ -397,7 +485,7 @@ class AgentStore:
         Returns:
             AgentEvent object.
         """
-        detail = json.loads(row["detail"])
+        detail = _load_detail(row["detail"])
 
         return AgentEvent(
             agent_id=row["agent_id"],
@@ -7,10 +7,29 @@ import sqlite3
 from typing import TYPE_CHECKING
 
 from cam.core.models import Context, MachineConfig, TransportType
+from cam.storage.database import DatabaseError
 
 if TYPE_CHECKING:
     from cam.storage.database import Database
 
+_INSERT_SQL = """
+    INSERT INTO contexts (id, name, path, machine_config, tags, created_at, last_used_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _context_params(context: Context) -> tuple:
+    """Column values for inserting *context*, in ``_INSERT_SQL`` order."""
+    return (
+        str(context.id),
+        context.name,
+        str(context.path),
+        json.dumps(context.machine.model_dump(mode="json")),
+        json.dumps(context.tags),
+        str(context.created_at) if context.created_at else None,
+        str(context.last_used_at) if context.last_used_at else None,
+    )
+
 
 class ContextStore:
     """Manages storage and retrieval of contexts."""
@@ -21,31 +40,38 @@ class ContextStore:
     def add(self, context: Context) -> None:
         """Add a new context."""
         try:
-            self.db.execute(
-                """
-                INSERT INTO contexts (id, name, path, machine_config, tags, created_at, last_used_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(context.id),
-                    context.name,
-                    str(context.path),
-                    json.dumps(context.machine.model_dump(mode="json")),
-                    json.dumps(context.tags),
-                    str(context.created_at) if context.created_at else None,
-                    str(context.last_used_at) if context.last_used_at else None,
-                ),
-            )
+            self.db.execute(_INSERT_SQL, _context_params(context))
         except sqlite3.IntegrityError as e:
             raise ContextStoreError(f"Context '{context.name}' already exists") from e
         except sqlite3.Error as e:
             raise ContextStoreError(f"Failed to add context: {e}") from e
 
+    def add_many(self, contexts: list[Context]) -> None:
+        """Add several contexts in a single transaction.
+
+        Names are checked against the store (and each other) up front, so
+        either every context is added or none are.
+        """
+        seen = {row["name"] for row in self.db.fetchall("SELECT name FROM contexts")}
+        for context in contexts:
+            if context.name in seen:
+                raise ContextStoreError(f"Context '{context.name}' already exists")
+            seen.add(context.name)
+
+        try:
+            with self.db.transaction():
+                self.db.executemany(_INSERT_SQL, [_context_params(c) for c in contexts])
+        except (sqlite3.Error, DatabaseError) as e:
+            raise ContextStoreError(f"Failed to add contexts: {e}") from e
+
     def get(self, name_or_id: str) -> Context | None:
-        """Get a context by name or ID."""
-        row = self.db.fetchone("SELECT * FROM contexts WHERE id = ?", (name_or_id,))
-        if not row:
-            row = self.db.fetchone("SELECT * FROM contexts WHERE name = ?", (name_or_id,))
+        """Get a context by name or ID (an ID match wins over a name match)."""
+        # Both columns are indexed (PRIMARY KEY / UNIQUE), so one OR query
+        # resolves either form without a second round-trip on a name lookup.
+        row = self.db.fetchone(
+            "SELECT * FROM contexts WHERE id = ? OR name = ? ORDER BY id = ? DESC LIMIT 1",
+            (name_or_id, name_or_id, name_or_id),
+        )
         return self._row_to_context(row) if row else None
 
     def list(
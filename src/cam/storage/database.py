@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from cam.constants import DB_PATH
 
@@ -34,6 +36,10 @@ class Database:
             isolation_level=None,  # Autocommit mode
         )
         self.conn.row_factory = sqlite3.Row
+        # The connection is shared by every thread (AgentManager runs store
+        # calls through asyncio.to_thread); statements and their result
+        # fetches are serialized on this lock.
+        self._lock = threading.RLock()
 
         # Enable WAL mode for better concurrent reads
         self.conn.execute("PRAGMA journal_mode=WAL")
@@ -165,7 +171,8 @@ class Database:
         Returns:
             Cursor object.
         """
-        return self._retry_on_lock(lambda: self.conn.execute(sql, params))
+        with self._lock:
+            return self._retry_on_lock(lambda: self.conn.execute(sql, params))
 
     def executemany(
         self, sql: str, params_list: list[tuple[Any, ...] | dict[str, Any]]
@@ -179,7 +186,26 @@ class Database:
         Returns:
             Cursor object.
         """
-        return self._retry_on_lock(lambda: self.conn.executemany(sql, params_list))
+        with self._lock:
+            return self._retry_on_lock(lambda: self.conn.executemany(sql, params_list))
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several statements into one transaction.
+
+        The connection runs in autocommit mode, so statements issued inside
+        this block are committed together on exit, or rolled back if the
+        block raises. The connection lock is held for the whole block so
+        statements from other threads cannot join the transaction.
+        """
+        with self._lock:
+            self.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.execute("COMMIT")
 
     def fetchone(
         self, sql: str, params: tuple[Any, ...] | dict[str, Any] = ()
@@ -193,8 +219,9 @@ class Database:
         Returns:
             Single row or None if no results.
         """
-        cursor = self.execute(sql, params)
-        return cursor.fetchone()
+        with self._lock:
+            cursor = self.execute(sql, params)
+            return cursor.fetchone()
 
     def fetchall(
         self, sql: str, params: tuple[Any, ...] | dict[str, Any] = ()
@@ -208,8 +235,9 @@ class Database:
         Returns:
             List of rows.
         """
-        cursor = self.execute(sql, params)
-        return cursor.fetchall()
+        with self._lock:
+            cursor = self.execute(sql, params)
+            return cursor.fetchall()
 
     def close(self) -> None:
         """Close database connection."""
@@ -5,9 +5,34 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 from cam.constants import LOG_DIR
 
 
+_ORJSON_OPTIONS = (
+    orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _dump_line(entry: dict) -> str:
+    """Serialize a log entry as one JSONL line (newline included)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, default=str, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib handles those
+    return json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+# catch the stdlib type either way.
+_load_line = orjson.loads if orjson is not None else json.loads
+
+
 class AgentLogger:
     """Writes structured JSONL logs for a single agent.
 
@@ -70,7 +95,7 @@ class AgentLogger:
             entry["output"] = output
 
         if self._file:
-            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.write(_dump_line(entry))
             self._file.flush()
 
     def read_lines(self, tail: int | None = None) -> list[dict]:
@@ -96,7 +121,7 @@ class AgentLogger:
             line = line.strip()
             if line:
                 try:
-                    entries.append(json.loads(line))
+                    entries.append(_load_line(line))
                 except json.JSONDecodeError:
                     # Skip malformed lines
                     continue
@@ -126,7 +151,7 @@ class AgentLogger:
                     line = line.strip()
                     if line:
                         try:
-                            yield json.loads(line)
+                            yield _load_line(line)
                         except json.JSONDecodeError:
                             # Skip malformed lines
                             continue
@@ -2,7 +2,7 @@
 
 import re
 
-from camc_pkg.utils import strip_ansi, clean_for_confirm
+from camc_pkg.utils import _BOX_CHARS, strip_ansi
 
 
 # Global input-box guard (2026-06-11).
@@ -43,10 +43,38 @@ def _find_cursor_line(lines):
     return None
 
 
+def _recent_lines(text, n, chars=None):
+    """Return the last ``n`` non-blank lines of ``text``, oldest first.
+
+    Walks back from the end of the buffer so only the tail is split;
+    ``chars``, when given, is stripped from each line before the blank
+    check (as ``clean_for_confirm`` does with box-drawing edges).
+    """
+    out = []
+    end = len(text)
+    while end > 0 and len(out) < n:
+        start = text.rfind("\n", 0, end) + 1
+        for line in reversed(text[start:end].splitlines()):
+            if chars is not None:
+                line = line.strip(chars)
+            if line.strip():
+                out.append(line)
+                if len(out) == n:
+                    break
+        end = start - 1
+    out.reverse()
+    return out
+
+
+def _recent_confirm_text(output, n):
+    """``clean_for_confirm`` applied to just the last ``n`` non-empty lines."""
+    return "\n".join(_recent_lines(output, n, _BOX_CHARS)).rstrip()
+
+
 def has_input_cursor(output, last_response="", prev_output=""):
     """True iff the input box is visible / active and auto-confirm
     must therefore skip. Three conditions documented above."""
-    tail_lines = [l for l in output.splitlines() if l.strip()][-8:]
+    tail_lines = _recent_lines(output, 8)
     cur_line = _find_cursor_line(tail_lines)
     if cur_line is None:
         return False
@@ -62,7 +90,7 @@ def has_input_cursor(output, last_response="", prev_output=""):
                 return True
     # (3) Cursor line changed since the previous capture
     if prev_output:
-        prev_tail = [l for l in prev_output.splitlines() if l.strip()][-8:]
+        prev_tail = _recent_lines(prev_output, 8)
         prev_cur = _find_cursor_line(prev_tail)
         if prev_cur is not None and prev_cur != cur_line:
             return True
@@ -76,7 +104,7 @@ def input_residue_count(output, last_response):
     that leaked into the input box."""
     if not last_response:
         return 0
-    tail_lines = [l for l in output.splitlines() if l.strip()][-8:]
+    tail_lines = _recent_lines(output, 8)
     cur_line = _find_cursor_line(tail_lines)
     if cur_line is None:
         return 0
@@ -117,13 +145,11 @@ def should_auto_confirm(output, config, last_response="", prev_output=""):
     if has_input_cursor(output, last_response=last_response,
                         prev_output=prev_output):
         return None
-    clean = clean_for_confirm(output)
     # Only check the last few non-empty lines — real permission dialogs
     # appear at the bottom of the screen.  Matching the full output causes
     # false positives when the agent's *response* contains trigger text
     # (e.g. a table mentioning "1. Yes").
-    lines = [l for l in clean.splitlines() if l.strip()]
-    recent = "\n".join(lines[-config.confirm_recent_lines:])
+    recent = _recent_confirm_text(output, config.confirm_recent_lines)
     for pattern, response, send_enter in config.confirm_rules:
         m = pattern.search(recent)
         if m:
@@ -185,9 +211,7 @@ def should_boot_confirm(output, config, last_response="", prev_output=""):
     """Boot-phase confirm rules — no input-cursor guard (onboarding menus)."""
     if config.strip_ansi:
         output = strip_ansi(output)
-    clean = clean_for_confirm(output)
-    lines = [l for l in clean.splitlines() if l.strip()]
-    recent = "\n".join(lines[-config.confirm_recent_lines:])
+    recent = _recent_confirm_text(output, config.confirm_recent_lines)
     for pattern, response, send_enter in config.confirm_rules:
         m = pattern.search(recent)
         if m:
@@ -33,7 +33,9 @@ after_confirm phase entirely. Health-check and auto-exit stay inline.
 
 import hashlib
 import logging
+import logging.handlers
 import os
+import select
 import signal
 import sys
 import time
@@ -44,7 +46,8 @@ from camc_pkg.adapters import _load_config, _load_boot_config
 from camc_pkg.storage import AgentStore, EventStore
 from camc_pkg.transport import (
     capture_tmux, tmux_session_exists, tmux_send_input, tmux_send_key,
-    tmux_kill_session, tmux_is_attached,
+    tmux_kill_session, tmux_is_attached, tmux_watch_pane, tmux_unwatch_pane,
+    _watch_pipe_alive,
 )
 from camc_pkg.detection import detect_completion, is_ready_for_input, is_ready_for_boot
 from camc_pkg.monitor_features import (
@@ -123,12 +126,72 @@ def _content_hash(text):
     return hashlib.md5(text.encode("utf-8")).hexdigest()[:8]
 
 
-def _apply_action(action, *, session, agent_id, store, events_fn):
+# Seconds of pane silence after a burst of output that count as "settled".
+_OUTPUT_SETTLE = 0.1
+
+
+def _wait_for_output(fd, timeout):
+    """Sleep up to ``timeout`` seconds, waking early once pane output settles.
+
+    ``fd`` is the read end from tmux_watch_pane; without one this is a
+    plain ``time.sleep``. A burst of output that then stops (typically a
+    confirm prompt being drawn) ends the wait ~_OUTPUT_SETTLE later.
+    Output that keeps streaming (spinners, timers) never settles, so a
+    busy pane is still polled at the normal cadence, not faster.
+    """
+    if fd is None:
+        time.sleep(timeout)
+        return
+    deadline = time.monotonic() + timeout
+    seen = False
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        try:
+            ready, _, _ = select.select(
+                [fd], [], [], min(remaining, _OUTPUT_SETTLE) if seen else remaining)
+        except (OSError, ValueError):
+            time.sleep(remaining)
+            return
+        if not ready:
+            if seen:
+                return
+            continue
+        seen = True
+        try:
+            while os.read(fd, 65536):
+                pass
+        except OSError:  # EAGAIN once the FIFO is drained
+            pass
+
+
+# Idle back-off: each unchanged tick stretches the wait by _IDLE_WAIT_GROWTH,
+# up to _IDLE_WAIT_MAX seconds; any screen change resets it to 1s.
+_IDLE_WAIT_GROWTH = 1.5
+_IDLE_WAIT_MAX = 5.0
+
+
+def _next_wait(wait, changed, pipe_alive=True):
+    """Return the wait before the next tick, given the current one.
+
+    Without a live pane pipe nothing ends the wait early, so stay at 1s.
+    """
+    if changed or not pipe_alive:
+        return 1.0
+    return min(wait * _IDLE_WAIT_GROWTH, _IDLE_WAIT_MAX)
+
+
+def _apply_action(action, *, session, agent_id, store, events_fn,
+                  pending=None):
     """Apply a single step action dict to the real world. Returns
     (halt_cycle, sleep_seconds). halt_cycle=True means the loop must
     stop running further steps in this cycle and skip the inline
     stuck-fallback / auto-exit blocks (matching the original
-    ``time.sleep(confirm_sleep); continue`` semantics)."""
+    ``time.sleep(confirm_sleep); continue`` semantics).
+
+    When ``pending`` is a dict, store_update fields are merged into it
+    instead of written; the caller flushes them with one store.update."""
     kind = action.get("kind")
     if kind == "log":
         getattr(log, action.get("level", "debug"))(action.get("msg", ""))
@@ -138,7 +201,10 @@ def _apply_action(action, *, session, agent_id, store, events_fn):
     elif kind == "send_key":
         tmux_send_key(session, action["key"])
     elif kind == "store_update":
-        store.update(agent_id, **action.get("fields", {}))
+        if pending is not None:
+            pending.update(action.get("fields", {}))
+        else:
+            store.update(agent_id, **action.get("fields", {}))
     elif kind == "event":
         events_fn(action["name"], action.get("detail"))
     elif kind == "halt_cycle":
@@ -194,23 +260,43 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
     runtime.last_health = runtime.last_change
     features = build_features()
     prev_output = ""
+    last_raw = last_h0 = last_h1 = None
     _refresh_boot_runtime(runtime, store, agent_id, boot_config)
 
+    # Wake on pane output instead of only on the 1s tick (needs a pid dir
+    # to hold the FIFO; without one the loop just sleeps).
+    watch_fifo = os.path.splitext(pid_path)[0] + ".fifo" if pid_path else None
+    watch_fd = tmux_watch_pane(session, watch_fifo) if watch_fifo else None
+    wait = 1.0
+
+    # store_update fields from one cycle's phases, written together: each
+    # store.update rewrites and fsyncs agents.json under the file lock.
+    pending_fields = {}
+
+    # Bound hooks per phase, resolved once: the feature set and each
+    # feature's ``enabled`` flag are fixed when build_features() returns.
+    phase_hooks = {}
+    for phase_name in ("before_confirm", "confirm", "after_confirm"):
+        phase_hooks[phase_name] = [
+            hook for hook in (getattr(feat, phase_name, None)
+                              for feat in features if feat.enabled)
+            if hook is not None]
+
+    # Per-tick config lookups, hoisted out of the loop.
+    health_interval = config.health_check_interval
+    busy_re = config.busy_pattern
+    done_re = config.done_pattern
+
     def _run_phase(snap, phase_name):
         """Apply the given phase hook on every enabled feature, in
         ``order`` ascending. Returns (halted, sleep_seconds) — halted
         signals the driver to skip remaining phases for this cycle."""
-        for feat in features:
-            if not feat.enabled:
-                continue
-            hook = getattr(feat, phase_name, None)
-            if hook is None:
-                continue
+        for hook in phase_hooks[phase_name]:
             for action in hook(snap, runtime):
                 halt, slp = _apply_action(
                     action,
                     session=session, agent_id=agent_id,
-                    store=store, events_fn=_event,
+                    store=store, events_fn=_event, pending=pending_fields,
                 )
                 if halt:
                     return True, slp
@@ -224,7 +310,7 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
             _refresh_boot_runtime(runtime, store, agent_id, boot_config)
 
             # --- 1. Health check (every 15s) ---
-            if now - runtime.last_health >= config.health_check_interval:
+            if now - runtime.last_health >= health_interval:
                 runtime.last_health = now
                 alive = tmux_session_exists(session)
                 log.debug("[%d] Health check: session=%s alive=%s", cycle, session, alive)
@@ -257,7 +343,10 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
 
             # --- 2. Capture screen ---
             output = capture_tmux(session)
-            if output.strip():
+            # isspace() stops at the first printable char and allocates
+            # nothing, unlike strip() on the whole capture.
+            blank = not output or output.isspace()
+            if not blank:
                 prev_output = output
 
             # Content hashes:
@@ -270,9 +359,14 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
             #           agent is still working, NOT idle. Used as a
             #           diagnostic and a guard against numeric churn
             #           starving idle detection.
-            normalized = _normalize_screen(output)
-            h0 = _content_hash(normalized)
-            h1 = _content_hash(_strip_ascii_digits(normalized))
+            # An identical raw capture (the common idle tick) normalizes
+            # to the same hashes, so skip the per-character pass.
+            if output != last_raw:
+                normalized = _normalize_screen(output)
+                last_raw = output
+                last_h0 = _content_hash(normalized)
+                last_h1 = _content_hash(_strip_ascii_digits(normalized))
+            h0, h1 = last_h0, last_h1
             prev_h_for_log = runtime.prev_hash
             changed = h0 != runtime.prev_hash
             runtime.prev_hash = h0
@@ -284,7 +378,7 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
             idle_for_hash1 = now - getattr(
                 runtime, "last_change_hash1", now)
 
-            if not output.strip():
+            if blank:
                 log.debug("[%d] Empty screen, skipping", cycle)
                 time.sleep(1)
                 continue
@@ -292,10 +386,8 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
             # Compute auxiliary screen signals + tail_lines for the snapshot.
             tail_lines = [l for l in output.rstrip("\n").split("\n") if l.strip()][-5:]
             tail_text = "\n".join(tail_lines)
-            screen_busy = (config.busy_pattern and
-                           bool(config.busy_pattern.search(tail_text)))
-            screen_done = (config.done_pattern and
-                           bool(config.done_pattern.search(tail_text)))
+            screen_busy = busy_re and bool(busy_re.search(tail_text))
+            screen_done = done_re and bool(done_re.search(tail_text))
             bare_prompt = any(
                 l.strip() in ("❯", ">", "›")  # ❯  >  ›
                 for l in tail_lines
@@ -341,6 +433,9 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
                 halted, halt_sleep = _run_phase(snap, "confirm")
             if not halted:
                 halted, halt_sleep = _run_phase(snap, "after_confirm")
+            if pending_fields:
+                store.update(agent_id, **pending_fields)
+                pending_fields.clear()
             if halted:
                 if halt_sleep > 0:
                     time.sleep(halt_sleep)
@@ -408,8 +503,16 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
                     else:
                         log.debug("[%d] Idle but auto_exit disabled", cycle)
 
-            time.sleep(1)
+            # Back off while the screen is static. Only safe while the pane
+            # pipe delivers: new output still ends the wait at once. If our
+            # pipe was replaced or died, drop back to the 1s tick. Boot keeps
+            # the 1s tick so startup prompts and deadlines are not delayed.
+            if watch_fd is not None and not runtime.in_initializing:
+                wait = _next_wait(wait, changed, _watch_pipe_alive(watch_fifo))
+            _wait_for_output(watch_fd, wait)
     finally:
+        if watch_fd is not None:
+            tmux_unwatch_pane(session, watch_fd, watch_fifo)
         if pid_path:
             try:
                 os.unlink(pid_path)
@@ -417,6 +520,10 @@ def run_monitor_loop(session, agent_id, config, store, pid_path=None, events=Non
                 pass
 
 
+# DEBUG records buffered before the monitor log is written out.
+_LOG_BATCH_RECORDS = 64
+
+
 def _run_monitor(agent_id):
     try:
         os.makedirs(LOGS_DIR, exist_ok=True)
@@ -425,11 +532,15 @@ def _run_monitor(agent_id):
     log_path = os.path.join(LOGS_DIR, "monitor-%s.log" % agent_id)
     for h in logging.root.handlers[:]:
         logging.root.removeHandler(h)
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s [monitor] %(levelname)s %(message)s",
-        filename=log_path,
-    )
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(logging.Formatter(
+        "%(asctime)s [monitor] %(levelname)s %(message)s"))
+    # Per-cycle DEBUG chatter (e.g. "idle but auto_exit disabled" every
+    # second) is written in batches; any INFO+ record flushes the batch
+    # immediately, so state changes and errors are never held back.
+    logging.root.addHandler(logging.handlers.MemoryHandler(
+        _LOG_BATCH_RECORDS, flushLevel=logging.INFO, target=file_handler))
+    logging.root.setLevel(logging.DEBUG)
     from camc_pkg import __version__, __build__
     log.info("Monitor starting for agent %s (pid=%d) camc=%s (%s)",
              agent_id, os.getpid(), __version__, __build__ or "dev")
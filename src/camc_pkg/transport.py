@@ -285,6 +285,85 @@ def tmux_is_attached(session_id):
     return False
 
 
+def tmux_watch_pane(session_id, fifo_path):
+    """Mirror a pane's output into a FIFO so a caller can wait for activity.
+
+    Uses ``tmux pipe-pane`` to feed everything the pane prints into
+    ``fifo_path``. Returns a non-blocking fd for the read end, or None
+    when the watch can't be set up (no mkfifo, tmux refused, ...); callers
+    then fall back to plain sleeping.
+
+    tmux allows one pipe per pane and pipe-pane silently replaces it, so
+    a pane that already has a pipe (e.g. cam's full-output log) is left
+    alone and None is returned.
+    """
+    base = _tmux_base(session_id)
+    target = "%s:0.0" % session_id
+    rc, out = _run(base + ["display-message", "-p", "-t", target, "#{pane_pipe}"])
+    if rc != 0 or out.strip() != "0":
+        log.debug("tmux_watch_pane: %s already has a pipe (or no pane)", session_id)
+        return None
+    try:
+        if os.path.exists(fifo_path):
+            os.unlink(fifo_path)
+        os.mkfifo(fifo_path, 0o600)
+        # O_RDWR holds a writer reference of our own, so select() never
+        # reports a spurious EOF before tmux's `cat` opens the FIFO or
+        # after it exits.
+        fd = os.open(fifo_path, os.O_RDWR | os.O_NONBLOCK)
+    except (OSError, AttributeError) as e:
+        log.debug("tmux_watch_pane: fifo setup failed: %s", e)
+        return None
+    # The pipe records its pid so tmux_unwatch_pane can tell whether the
+    # active pipe is still ours.
+    command = "echo $$ > %s; exec cat >> %s" % (
+        shlex.quote(fifo_path + ".pid"), shlex.quote(fifo_path))
+    rc, _ = _run(base + ["pipe-pane", "-t", target, command])
+    if rc != 0:
+        log.debug("tmux_watch_pane: pipe-pane failed for %s", session_id)
+        os.close(fd)
+        try:
+            os.unlink(fifo_path)
+        except OSError:
+            pass
+        return None
+    return fd
+
+
+def _watch_pipe_alive(fifo_path):
+    """True while the `cat` started by tmux_watch_pane is still running.
+
+    tmux closes a pipe it replaces, which ends that `cat`.
+    """
+    try:
+        with open(fifo_path + ".pid") as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def tmux_unwatch_pane(session_id, fd, fifo_path):
+    """Undo tmux_watch_pane: stop the pane pipe and remove the FIFO.
+
+    The pane's pipe is only closed while it is still the one we opened;
+    if something else has since replaced it, that pipe is left running.
+    """
+    if _watch_pipe_alive(fifo_path):
+        # pipe-pane with no command closes the pane's existing pipe.
+        _run(_tmux_base(session_id) + ["pipe-pane", "-t", "%s:0.0" % session_id])
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+    for path in (fifo_path, fifo_path + ".pid"):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
 def tmux_kill_session(session_id):
     socket = _find_tmux_socket(session_id)
     tmux = _tmux_bin_for_session(session_id)
@@ -23,6 +23,9 @@ _ANSI_RE = re.compile(
 
 
 def strip_ansi(text):
+    # Captures are usually already clean; skip the regex pass when no ESC.
+    if "\x1b" not in text:
+        return text
     return _ANSI_RE.sub("", text)
 
 
@@ -104,3 +104,84 @@ def test_legacy_agent_without_machine_host_uses_context(monkeypatch):
     ), context)
 
     _agent_obj, _camc_id, delegate = manager._resolve_agent_delegate("agent001")
+
+
+async def test_follow_backs_off_while_state_is_unchanged(monkeypatch):
+    import cam.core.agent_manager as agent_manager
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(agent_manager.asyncio, "sleep", fake_sleep)
+    polls = iter([
+        {"status": "running", "state": "editing"},
+        {"status": "running", "state": "editing"},
+        {"status": "running", "state": "editing"},
+        {"status": "running", "state": "testing"},
+        {"status": "completed", "state": "idle"},
+    ])
+    delegate = MagicMock()
+    delegate.get_agent.side_effect = lambda _id: next(polls)
+    manager, _ = _manager(_agent())
+
+    await manager._follow_camc_agent(delegate, _agent())
+
+    assert sleeps == [3.0, 3.0, 6.0, 12.0, 3.0]
+
+
+async def test_reconcile_builds_one_transport_per_context():
+    created = []
+
+    class FakeTransport:
+        async def session_exists(self, session_id):
+            return True
+
+    class FakeFactory:
+        @staticmethod
+        def create(machine):
+            created.append(machine)
+            return FakeTransport()
+
+    context = Context(id="ctx1", name="proj", path="/tmp/project", machine=MachineConfig())
+    agents = [
+        _agent(id=f"agent00{i}", context_id="ctx1", tmux_session=f"cam-{i}") for i in range(3)
+    ]
+    agent_store = MagicMock()
+    agent_store.list.return_value = agents
+    context_store = MagicMock()
+    context_store.get.return_value = context
+    manager = AgentManager(
+        config=MagicMock(),
+        context_store=context_store,
+        agent_store=agent_store,
+        event_bus=MagicMock(),
+        transport_factory_class=FakeFactory,
+    )
+
+    assert await manager.reconcile() == []
+    assert len(created) == 1
+    context_store.get.assert_called_once_with("ctx1")
+
+
+def test_create_transport_is_cached_per_machine():
+    class FakeFactory:
+        @staticmethod
+        def create(machine):
+            return object()
+
+    manager = AgentManager(
+        config=MagicMock(),
+        context_store=MagicMock(),
+        agent_store=MagicMock(),
+        event_bus=MagicMock(),
+        transport_factory_class=FakeFactory,
+    )
+    ssh = MachineConfig(type=TransportType.SSH, host="h", user="u")
+    a = Context(name="a", path="/a", machine=ssh)
+    b = Context(name="b", path="/b", machine=ssh.model_copy())
+    local = Context(name="c", path="/c", machine=MachineConfig())
+
+    assert manager._create_transport(a) is manager._create_transport(b)
+    assert manager._create_transport(a) is not manager._create_transport(local)
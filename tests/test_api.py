@@ -347,6 +347,17 @@ class TestWebSocket:
             assert data["event_type"] == "test_event"
             assert data["detail"]["key"] == "value"
 
+    def test_ws_burst_arrives_in_order(self, app_and_token):
+        client, token = app_and_token
+        with client.websocket_connect(f"/api/ws?token={token}") as ws:
+            state = client.app.state.server
+            for i in range(5):
+                state.event_bus.publish(
+                    AgentEvent(agent_id="burst", event_type=f"e{i}", detail={})
+                )
+            received = [ws.receive_json()["event_type"] for _ in range(5)]
+            assert received == [f"e{i}" for i in range(5)]
+
     def test_ws_agent_id_filter(self, app_and_token):
         client, token = app_and_token
         with client.websocket_connect(
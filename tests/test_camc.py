@@ -264,6 +264,52 @@ class TestTmuxSendInputBracketedPaste:
 # camc msg — non-blocking send (--no-wait) + wait subcommand
 # ---------------------------------------------------------------------------
 
+class TestTmuxWatchPane:
+    """tmux keeps one pipe per pane; the monitor's watch must never
+    replace or tear down a pipe it did not open (e.g. cam's output log)."""
+
+    def _calls(self, monkeypatch, pane_pipe="0"):
+        from camc_pkg import transport
+        calls = []
+
+        def fake_run(args, **kw):
+            calls.append(args)
+            return 0, pane_pipe + "\n" if "display-message" in args else ""
+
+        monkeypatch.setattr(transport, "_run", fake_run)
+        return calls
+
+    def test_existing_pipe_is_left_alone(self, tmp_path, monkeypatch):
+        from camc_pkg.transport import tmux_watch_pane
+        calls = self._calls(monkeypatch, pane_pipe="1")
+        assert tmux_watch_pane("s", str(tmp_path / "w.fifo")) is None
+        assert not any("pipe-pane" in c for c in calls)
+        assert not (tmp_path / "w.fifo").exists()
+
+    def test_unwatch_skips_pipe_that_is_no_longer_ours(self, tmp_path, monkeypatch):
+        from camc_pkg.transport import tmux_unwatch_pane, tmux_watch_pane
+        calls = self._calls(monkeypatch)
+        fifo = str(tmp_path / "w.fifo")
+        fd = tmux_watch_pane("s", fifo)
+        assert fd is not None and any("pipe-pane" in c for c in calls)
+        # No live pid file: our `cat` was replaced (or never started)
+        del calls[:]
+        tmux_unwatch_pane("s", fd, fifo)
+        assert calls == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unwatch_closes_own_pipe(self, tmp_path, monkeypatch):
+        import os
+        from camc_pkg.transport import tmux_unwatch_pane, tmux_watch_pane
+        calls = self._calls(monkeypatch)
+        fifo = str(tmp_path / "w.fifo")
+        fd = tmux_watch_pane("s", fifo)
+        (tmp_path / "w.fifo.pid").write_text(str(os.getpid()))
+        del calls[:]
+        tmux_unwatch_pane("s", fd, fifo)
+        assert [c[-3:] for c in calls] == [["pipe-pane", "-t", "s:0.0"]]
+
+
 class TestMsgNoWait:
     """`camc msg send <to> -t "..." --no-wait` injects + returns immediately
     with MSG_ID=<8hex>/STATUS=sent on stdout. The blocking default is
@@ -297,3 +297,29 @@ def test_import_stamps_transport_from_machine_type(monkeypatch, poller_setup):
     rebuilt = _camc_agent_to_model(row, machine_type="ssh",
                                    machine_host="localhost", machine_port=3222)
     assert rebuilt.transport_type == TransportType.SSH
+
+
+def test_unchanged_agent_is_not_rewritten(monkeypatch, agent_store):
+    """A re-poll that reports the same agent leaves the row alone; a
+    changed field is still written through."""
+    from cam.core.camc_poller import CamcPoller
+
+    poller = CamcPoller(agent_store=agent_store, context_store=MagicMock(),
+                        event_bus=MagicMock())
+    monkeypatch.setattr(poller, "_load_machines",
+                        lambda: [{"name": "m1", "host": None, "user": "u", "port": None}])
+    row = _mk_camc_row("same0001", "running")
+    monkeypatch.setattr(poller, "_get_delegate",
+                        lambda *a, **kw: _stub_delegate([row]))
+    asyncio.run(poller.poll_once())
+
+    saves = []
+    real_save = agent_store.save
+    monkeypatch.setattr(agent_store, "save", lambda a: saves.append(a) or real_save(a))
+    asyncio.run(poller.poll_once())
+    assert saves == []
+
+    row["state"] = "editing"
+    asyncio.run(poller.poll_once())
+    assert [a.state.value for a in saves] == ["editing"]
+    assert agent_store.get("same0001").state.value == "editing"
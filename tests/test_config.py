@@ -29,6 +29,14 @@ class TestParseDuration:
     def test_empty(self):
         assert parse_duration("") is None
 
+    def test_fractional_and_spaced(self):
+        assert parse_duration("1.5h") == 5400
+        assert parse_duration("2 M") == 120
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Invalid duration format: 5x"):
+            parse_duration("5x")
+
 
 class TestCamConfig:
     def test_defaults(self):
@@ -46,3 +54,201 @@ class TestCamConfig:
         assert config.monitor.poll_interval == 10
         # Other monitor values should remain default
         assert config.monitor.idle_timeout == 300
+
+
+class TestConfigCmdToml:
+    def test_load_config_toml_missing(self, tmp_path):
+        from cam.cli.config_cmd import _load_config_toml
+
+        assert _load_config_toml(tmp_path / "config.toml") == {}
+
+    def test_load_config_toml_returns_copy(self, tmp_path):
+        from cam.cli.config_cmd import _load_config_toml
+
+        path = tmp_path / "config.toml"
+        path.write_text('[monitor]\npoll_interval = 5\n')
+        first = _load_config_toml(path)
+        first["monitor"]["poll_interval"] = 99
+        assert _load_config_toml(path) == {"monitor": {"poll_interval": 5}}
+
+    def test_write_toml_simple_roundtrip(self, tmp_path):
+        from cam.cli.config_cmd import _load_config_toml, _write_toml_simple
+
+        data = {"a": 1, "general": {"tool": "codex", "nested": {"xs": [1, 2]}}, "b": True}
+        path = tmp_path / "config.toml"
+        _write_toml_simple(path, data)
+        assert _load_config_toml(path) == data
+
+    def test_config_set_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        from cam.cli import config_cmd
+
+        def broken_write(path, data):
+            path.write_text("partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(config_cmd, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config_cmd, "_write_toml", broken_write)
+        with pytest.raises(OSError):
+            config_cmd.config_set("monitor.poll_interval", "5")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_toml_value_types(self):
+        from cam.cli.config_cmd import _toml_value
+
+        assert _toml_value(True) == "true"
+        assert _toml_value(0) == "0"
+        assert _toml_value(2.5) == "2.5"
+        assert _toml_value("x") == '"x"'
+        assert _toml_value([1, False, "a"]) == '[1, false, "a"]'
+
+    def test_parse_value(self):
+        from cam.cli.config_cmd import _parse_value
+
+        assert _parse_value("Yes") is True
+        assert _parse_value("false") is False
+        assert _parse_value("5") == 5 and isinstance(_parse_value("5"), int)
+        assert _parse_value("-3") == -3
+        assert _parse_value("2.5") == 2.5
+        assert _parse_value("1e3") == 1000.0
+        assert _parse_value("codex") == "codex"
+        assert _parse_value("1.2.3") == "1.2.3"
+        assert _parse_value("1_000") == 1000
+        assert _parse_value("inf") == float("inf")
+        assert _parse_value(" 7 ") == 7
+
+
+class TestLoadConfigCache:
+    def test_reuses_result_until_global_config_changes(self, tmp_path, monkeypatch):
+        import os
+
+        from cam.core import config as config_mod
+
+        global_config = tmp_path / "config.toml"
+        global_config.write_text('[general]\ndefault_tool = "codex"\n')
+        monkeypatch.setattr(config_mod, "GLOBAL_CONFIG", global_config)
+        monkeypatch.setattr(config_mod, "_config_cache", {})
+
+        calls = []
+        real_load_toml = config_mod._load_toml
+        monkeypatch.setattr(
+            config_mod, "_load_toml", lambda p: calls.append(p) or real_load_toml(p)
+        )
+
+        first = load_config()
+        second = load_config()
+        assert first.general.default_tool == second.general.default_tool == "codex"
+        assert first is not second
+        assert calls.count(global_config) == 1
+
+        global_config.write_text('[general]\ndefault_tool = "aider"\n')
+        st = global_config.stat()
+        os.utime(global_config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config().general.default_tool == "aider"
+
+    def test_env_change_is_not_served_from_cache(self, monkeypatch):
+        first = load_config()
+        monkeypatch.setenv("CAM_DEFAULT_TOOL", "codex")
+        assert load_config().general.default_tool == "codex"
+        assert first.general.default_tool != "codex"
+
+
+class TestLoadToml:
+    def test_invalid_toml_is_skipped_with_warning(self, tmp_path, capsys):
+        from cam.core.config import _load_toml, read_toml
+
+        path = tmp_path / "config.toml"
+        path.write_text("[general\n")
+        assert _load_toml(path) == {}
+        assert "Failed to load" in capsys.readouterr().out
+        with pytest.raises(ValueError):
+            read_toml(path)
+
+
+class TestFindProjectConfig:
+    def test_walks_up_and_notices_new_config(self, tmp_path, monkeypatch):
+        from cam.core.config import _find_project_config
+
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+        assert _find_project_config() is None
+
+        (nested / ".cam").mkdir()
+        (nested / ".cam" / "config.toml").write_text("")
+        assert _find_project_config() == nested / ".cam" / "config.toml"
+
+    def test_notices_config_added_closer_or_in_existing_cam_dir(self, tmp_path, monkeypatch):
+        from cam.core.config import _find_project_config
+
+        (tmp_path / ".cam").mkdir()
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+        assert _find_project_config() is None
+
+        # Ancestor's .cam dir already existed; only its contents change
+        (tmp_path / ".cam" / "config.toml").write_text("")
+        assert _find_project_config() == tmp_path / ".cam" / "config.toml"
+
+        # A config between the CWD and the found one takes precedence
+        (tmp_path / "a" / ".cam").mkdir()
+        (tmp_path / "a" / ".cam" / "config.toml").write_text("")
+        assert _find_project_config() == tmp_path / "a" / ".cam" / "config.toml"
+
+    def test_found_config_removed(self, tmp_path, monkeypatch):
+        from cam.core.config import _find_project_config
+
+        config = tmp_path / ".cam" / "config.toml"
+        config.parent.mkdir()
+        config.write_text("")
+        nested = tmp_path / "sub"
+        nested.mkdir()
+        monkeypatch.chdir(nested)
+        assert _find_project_config() == config
+
+        config.unlink()
+        assert _find_project_config() is None
+
+
+class TestApplyEnvVars:
+    def test_converts_by_type(self, monkeypatch):
+        from cam.core.config import _apply_env_vars
+
+        monkeypatch.setenv("CAM_AUTO_CONFIRM", "off")
+        monkeypatch.setenv("CAM_SERVER_PORT", "9000")
+        monkeypatch.setenv("CAM_BACKOFF_BASE", "1.5")
+        monkeypatch.setenv("CAM_LOG_LEVEL", "debug")
+        result = _apply_env_vars({"general": {"default_tool": "codex"}})
+        assert result["general"] == {
+            "default_tool": "codex",
+            "auto_confirm": False,
+            "log_level": "debug",
+        }
+        assert result["server"] == {"port": 9000}
+        assert result["retry"] == {"backoff_base": 1.5}
+
+    def test_no_cam_env_returns_input(self, monkeypatch):
+        import os
+
+        from cam.core.config import _apply_env_vars
+
+        for name in [k for k in os.environ if k.startswith("CAM_")]:
+            monkeypatch.delenv(name)
+        config = {"general": {"log_level": "info"}}
+        assert _apply_env_vars(config) is config
+
+
+class TestMergeDicts:
+    def test_deep_merge_leaves_inputs_untouched(self):
+        from cam.core.config import _merge_dicts
+
+        base = {"general": {"tool": "claude", "nested": {"a": 1, "b": 2}}, "x": [1]}
+        override = {"general": {"nested": {"b": 3}}, "x": [2], "new": {"k": "v"}}
+        merged = _merge_dicts(base, override)
+        assert merged == {
+            "general": {"tool": "claude", "nested": {"a": 1, "b": 3}},
+            "x": [2],
+            "new": {"k": "v"},
+        }
+        assert base == {"general": {"tool": "claude", "nested": {"a": 1, "b": 2}}, "x": [1]}
+        assert override == {"general": {"nested": {"b": 3}}, "x": [2], "new": {"k": "v"}}
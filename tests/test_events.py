@@ -0,0 +1,70 @@
+"""Tests for the EventBus."""
+
+from __future__ import annotations
+
+from cam.core.events import EventBus
+from cam.core.models import AgentEvent
+
+
+def _event(event_type: str) -> AgentEvent:
+    return AgentEvent(agent_id="a1", event_type=event_type)
+
+
+class TestEventBus:
+    def test_specific_handlers_run_before_wildcard(self):
+        bus = EventBus()
+        seen = []
+        bus.subscribe("*", lambda e: seen.append(("*", e.event_type)))
+        bus.subscribe("state_change", lambda e: seen.append(("specific", e.event_type)))
+
+        bus.publish(_event("state_change"))
+        bus.publish(_event("other"))
+
+        assert seen == [
+            ("specific", "state_change"),
+            ("*", "state_change"),
+            ("*", "other"),
+        ]
+
+    def test_subscribe_and_unsubscribe_after_publish(self):
+        bus = EventBus()
+        seen = []
+        bus.publish(_event("tick"))
+
+        def handler(e):
+            seen.append(e.event_type)
+
+        bus.subscribe("tick", handler)
+        bus.publish(_event("tick"))
+        bus.unsubscribe("tick", handler)
+        bus.publish(_event("tick"))
+
+        assert seen == ["tick"]
+
+    def test_handler_errors_are_swallowed(self):
+        bus = EventBus()
+        seen = []
+
+        def broken(e):
+            raise RuntimeError("boom")
+
+        bus.subscribe("tick", broken)
+        bus.subscribe("tick", lambda e: seen.append(e.event_type))
+        bus.publish(_event("tick"))
+
+        assert seen == ["tick"]
+
+    def test_unsubscribing_last_wildcard_stops_delivery(self):
+        bus = EventBus()
+        seen = []
+
+        def wildcard(e):
+            seen.append(e.event_type)
+
+        bus.subscribe("*", wildcard)
+        bus.publish(_event("a"))
+        bus.unsubscribe("*", wildcard)
+        bus.unsubscribe("never-subscribed", wildcard)
+        bus.publish(_event("b"))
+
+        assert seen == ["a"]
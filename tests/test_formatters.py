@@ -0,0 +1,102 @@
+"""Tests for CLI formatting helpers."""
+
+from __future__ import annotations
+
+from cam.cli.formatters import format_duration, format_timestamp
+
+
+class TestFormatDuration:
+    def test_none_and_negative(self):
+        assert format_duration(None) == "-"
+        assert format_duration(-5) == "0s"
+
+    def test_seconds(self):
+        assert format_duration(0) == "0s"
+        assert format_duration(59.9) == "59s"
+
+    def test_minutes(self):
+        assert format_duration(60) == "1m"
+        assert format_duration(61) == "1m 1s"
+
+    def test_hours_and_days(self):
+        assert format_duration(3600) == "1h"
+        assert format_duration(3660) == "1h 1m"
+        assert format_duration(86400) == "1d"
+        assert format_duration(90000) == "1d 1h"
+
+
+class TestFormatTimestamp:
+    def test_none(self):
+        assert format_timestamp(None) == "-"
+
+    def test_matches_strftime(self):
+        from datetime import datetime, timedelta, timezone
+
+        for dt in (
+            datetime(2026, 1, 2, 3, 4, 5, 678901),
+            datetime(2026, 12, 31, 23, 59, 59, tzinfo=timezone(timedelta(hours=-5))),
+        ):
+            assert format_timestamp(dt) == dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class TestDumpsJson:
+    def test_matches_stdlib_semantics(self):
+        import json
+        from datetime import datetime, timezone
+
+        from cam.cli.formatters import _dumps_json
+
+        data = {"a": [1, 2.5, None, True], "when": datetime(2026, 1, 1, tzinfo=timezone.utc), 1: "x"}
+        assert json.loads(_dumps_json(data)) == json.loads(json.dumps(data, default=str))
+
+    def test_falls_back_for_unsupported_values(self):
+        import json
+
+        from cam.cli.formatters import _dumps_json
+
+        assert json.loads(_dumps_json({"big": 2**70})) == {"big": 2**70}
+
+
+class TestPrintNdjson:
+    def test_one_object_per_line(self, capsys):
+        import json
+
+        from cam.cli.formatters import print_ndjson
+        from cam.core.models import Context
+
+        ctx = Context(name="alpha", path="/tmp/a")
+        print_ndjson(iter([ctx, {"id": "x", "n": 1}]))
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["name"] == "alpha"
+        assert json.loads(lines[1]) == {"id": "x", "n": 1}
+
+    def test_ndjson_mode_implies_json_mode(self):
+        from cam.cli import formatters
+
+        try:
+            formatters.set_json_mode(False)
+            formatters.set_ndjson_mode(True)
+            assert formatters.is_json_mode() and formatters.is_ndjson_mode()
+        finally:
+            formatters.set_ndjson_mode(False)
+            formatters.set_json_mode(False)
+
+
+class TestDetailPanels:
+    def test_values_are_not_parsed_as_markup(self, monkeypatch):
+        import io
+
+        from rich.console import Console
+
+        from cam.cli import formatters
+        from cam.core.models import Context
+
+        buf = io.StringIO()
+        monkeypatch.setattr(formatters.console, "_console", Console(file=buf, width=100))
+        formatters.print_context_detail(
+            Context(name="demo", path="/tmp/[bold]x", tags=["[red]t"])
+        )
+        out = buf.getvalue()
+        assert "/tmp/[bold]x" in out
+        assert "[red]t" in out
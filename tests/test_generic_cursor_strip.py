@@ -75,3 +75,12 @@ class TestRuntimeCursorAnchoredConfirm:
             "❯ \n"
         )
         assert should_auto_confirm(screen, cfg) is None
+
+    def test_only_recent_lines_are_matched(self):
+        cfg = _Cfg([_rule(r"^❯\s+1\.\s*Yes")])
+        cfg.confirm_recent_lines = 3
+        menu = u"│ ❯ 1. Yes │\n│   2. No  │\n"
+        assert should_auto_confirm(menu + u"│          │\n", cfg) is not None
+        # Box-only lines are blank after cleaning and do not use up the window.
+        assert should_auto_confirm(menu + u"│          │\n" * 20, cfg) is not None
+        assert should_auto_confirm(menu + "done\n" * 3, cfg) is None
@@ -43,6 +43,21 @@ class TestMachineConfig:
         assert config.host == "example.com"
         assert config.user == "dev"
 
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"type": TransportType.SSH, "host": "h"}, "SSH transport requires 'user'"),
+            ({"type": TransportType.DOCKER}, "DOCKER transport requires 'image'"),
+            (
+                {"type": TransportType.WEBSOCKET, "host": "h"},
+                "WEBSOCKET transport requires 'agent_port'",
+            ),
+        ],
+    )
+    def test_missing_required_field(self, kwargs, message):
+        with pytest.raises(ValidationError, match=message):
+            MachineConfig(**kwargs)
+
 
 class TestContext:
     def test_create_local(self):
@@ -136,6 +151,22 @@ class TestAgent:
             status=AgentStatus.RUNNING,
         )
         assert not agent.is_terminal()
+        assert agent.is_active()
+
+    def test_add_event_keeps_latest_events(self, monkeypatch):
+        from cam.core import models
+
+        monkeypatch.setattr(models, "_MAX_INLINE_EVENTS", 3)
+        agent = Agent(
+            task=TaskDefinition(tool="claude", prompt="test"),
+            context_id=str(uuid4()),
+            context_name="ctx",
+            context_path="/tmp",
+            transport_type=TransportType.LOCAL,
+        )
+        for i in range(5):
+            agent.add_event("tick", {"i": i})
+        assert [e["detail"]["i"] for e in agent.events] == [2, 3, 4]
 
     def test_pid_must_be_positive(self):
         with pytest.raises(ValidationError):
@@ -148,6 +179,20 @@ class TestAgent:
                 pid=-1,
             )
 
+    def test_duration_uses_given_now_for_running_agent(self):
+        agent = Agent(
+            task=TaskDefinition(tool="claude", prompt="test"),
+            context_id=str(uuid4()),
+            context_name="ctx",
+            context_path="/tmp",
+            transport_type=TransportType.LOCAL,
+            status=AgentStatus.RUNNING,
+            started_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        now = datetime(2026, 1, 1, 0, 1, 30, tzinfo=timezone.utc)
+        assert agent.duration_seconds(now) == 90.0
+        assert agent.duration_seconds() > 90.0
+
 
 class TestAgentEvent:
     def test_create(self):
@@ -259,7 +259,7 @@ def screen_false_positive():
 # ---------------------------------------------------------------------------
 
 def run_monitor_steps(screens, store=None, config=None, auto_exit=False,
-                      session_alive=True, max_cycles=None):
+                      session_alive=True, max_cycles=None, pid_path=None):
     """Run monitor loop with mocked transport. Returns (store, events).
 
     Uses a fake clock so that timer-based logic (health check, confirm cooldown,
@@ -324,7 +324,7 @@ def run_monitor_steps(screens, store=None, config=None, auto_exit=False,
          patch("camc_pkg.monitor.signal.signal", side_effect=mock_signal):
         try:
             run_monitor_loop("test-session", "test-001", config, store,
-                             events=events)
+                             pid_path=pid_path, events=events)
         except StopIteration:
             pass
 
@@ -507,6 +507,17 @@ class TestStep7PureScreenIdle:
         confirms = events.of_type("auto_confirm")
         assert len(confirms) >= 1
 
+    def test_identical_screen_normalized_once(self):
+        """An unchanged raw capture reuses the previous tick's hashes."""
+        from camc_pkg import monitor
+
+        screens = [screen_idle()] * 10
+        with patch("camc_pkg.monitor._normalize_screen",
+                   wraps=monitor._normalize_screen) as normalize:
+            store, events = run_monitor_steps(screens, max_cycles=12)
+        assert normalize.call_count == 1
+        assert len(events.of_type("idle_confirmed")) >= 1
+
 
 class TestStep8AutoExit:
     """Step 8: Auto-exit on idle."""
@@ -536,6 +547,78 @@ class TestStep8AutoExit:
         assert store.last_status is None or store.last_status != "completed"
 
 
+class TestWaitForOutput:
+    """The end-of-cycle wait wakes early once a burst of pane output stops."""
+
+    def test_without_watch_fd_sleeps(self):
+        from camc_pkg.monitor import _wait_for_output
+
+        with patch("camc_pkg.monitor.time.sleep") as sleep:
+            _wait_for_output(None, 1)
+        sleep.assert_called_once_with(1)
+
+    def test_burst_then_quiet_wakes_early(self):
+        import os
+        from camc_pkg.monitor import _wait_for_output
+
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        try:
+            threading.Timer(0.1, os.write, (w, b"Allow? (y/n)")).start()
+            start = time.time()
+            _wait_for_output(r, 2)
+            assert time.time() - start < 1.0
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_idle_wait_backs_off_and_resets(self):
+        from camc_pkg.monitor import _IDLE_WAIT_MAX, _next_wait
+
+        waits = [1.0]
+        for _ in range(10):
+            waits.append(_next_wait(waits[-1], changed=False))
+        assert waits[1] == 1.5
+        assert waits == sorted(waits) and waits[-1] == _IDLE_WAIT_MAX
+        assert _next_wait(waits[-1], changed=True) == 1.0
+        assert _next_wait(waits[-1], changed=False, pipe_alive=False) == 1.0
+
+    def test_loop_stops_backing_off_once_pane_pipe_is_gone(self, tmp_path):
+        from camc_pkg import monitor
+
+        waits = []
+        alive = [True]
+
+        def fake_wait(fd, timeout):
+            waits.append(timeout)
+            if len(waits) == 8:
+                alive[0] = False  # e.g. another pipe-pane replaced ours
+            monitor.time.sleep(timeout)  # advances the helper's fake clock
+
+        with patch.object(monitor, "tmux_watch_pane", return_value=99), \
+             patch.object(monitor, "tmux_unwatch_pane"), \
+             patch.object(monitor, "_watch_pipe_alive", side_effect=lambda p: alive[0]), \
+             patch.object(monitor, "_wait_for_output", side_effect=fake_wait):
+            run_monitor_steps([screen_idle()] * 16, pid_path=str(tmp_path / "a.pid"))
+
+        assert max(waits[:8]) > 1.0
+        assert waits[8:] and set(waits[8:]) == {1.0}
+
+
+class TestApplyAction:
+    def test_store_updates_merge_into_pending(self):
+        from camc_pkg.monitor import _apply_action
+
+        store = MockStore()
+        pending = {}
+        for fields in ({"state": "editing"}, {"state": "idle", "has_worked": True}):
+            _apply_action({"kind": "store_update", "fields": fields},
+                          session="s", agent_id=store.agent_id, store=store,
+                          events_fn=None, pending=pending)
+        assert store.updates == []
+        assert pending == {"state": "idle", "has_worked": True}
+
+
 class TestFullLifecycle:
     """End-to-end lifecycle tests."""
 
@@ -76,3 +76,58 @@ class TestTaskGraph:
         t = _task("my-task")
         graph = TaskGraph([t])
         assert graph.get_task("my-task").prompt == "Do my-task"
+
+
+class TestLoadTaskFile:
+    def test_loads_tasks_and_defaults(self, tmp_path):
+        from cam.core.scheduler import load_task_file
+
+        path = tmp_path / "tasks.yaml"
+        path.write_text(
+            "defaults:\n"
+            "  tool: codex\n"
+            "tasks:\n"
+            "  - name: a\n"
+            "    prompt: \"Résumé ✓\"\n"
+            "  - name: b\n"
+            "    prompt: Do b\n"
+            "    depends_on: a\n",
+            encoding="utf-8",
+        )
+        tasks, _ = load_task_file(str(path))
+        assert [t.name for t in tasks] == ["a", "b"]
+        assert tasks[0].prompt == "Résumé ✓"
+        assert tasks[0].tool == "codex"
+        assert tasks[1].depends_on == ["a"]
+
+    def test_invalid_yaml(self, tmp_path):
+        from cam.core.scheduler import load_task_file
+
+        path = tmp_path / "tasks.yaml"
+        path.write_text("tasks: [unclosed\n")
+        with pytest.raises(SchedulerError, match="Invalid YAML"):
+            load_task_file(str(path))
+
+
+class TestSchedulerExecute:
+    async def test_context_looked_up_once_per_name(self):
+        from types import SimpleNamespace
+
+        from cam.core.models import AgentStatus
+        from cam.core.scheduler import Scheduler
+
+        lookups: list[str] = []
+
+        class _Contexts:
+            def get(self, name):
+                lookups.append(name)
+                return SimpleNamespace(name=name)
+
+        class _Manager:
+            async def run_agent(self, task, context, follow=False):
+                return SimpleNamespace(status=AgentStatus.COMPLETED)
+
+        graph = TaskGraph([_task("a"), _task("b"), _task("c", ["a", "b"])])
+        results = await Scheduler(_Manager(), _Contexts()).execute(graph, default_context="ctx")
+        assert sorted(results) == ["a", "b", "c"]
+        assert lookups == ["ctx"]
@@ -38,6 +38,13 @@ class TestContextStore:
         assert retrieved is not None
         assert retrieved.id == sample_context.id
 
+    def test_get_prefers_id_over_name(self, context_store):
+        first = Context(name="alpha", path="/tmp/a")
+        context_store.add(first)
+        # A second context whose *name* equals the first one's ID
+        context_store.add(Context(name=first.id, path="/tmp/b"))
+        assert context_store.get(first.id).name == "alpha"
+
     def test_list(self, context_store, sample_context):
         context_store.add(sample_context)
         contexts = context_store.list()
@@ -63,6 +70,41 @@ class TestContextStore:
         context_store.add(sample_context)
         assert context_store.exists(sample_context.name)
 
+    def test_update_in_place(self, context_store, sample_context):
+        context_store.add(sample_context)
+        sample_context.path = "/tmp/moved"
+        sample_context.tags = ["test", "extra"]
+        context_store.update(sample_context)
+        retrieved = context_store.get(sample_context.id)
+        assert retrieved.path == "/tmp/moved"
+        assert retrieved.tags == ["test", "extra"]
+        assert len(context_store.list()) == 1
+
+    def test_add_many(self, context_store):
+        contexts = [Context(name=f"ctx-{i}", path=f"/tmp/p{i}") for i in range(3)]
+        context_store.add_many(contexts)
+        assert sorted(c.name for c in context_store.list()) == ["ctx-0", "ctx-1", "ctx-2"]
+
+    def test_add_many_is_all_or_nothing(self, context_store, sample_context):
+        from cam.storage.context_store import ContextStoreError
+
+        context_store.add(sample_context)
+        batch = [
+            Context(name="fresh", path="/tmp/fresh"),
+            Context(name=sample_context.name, path="/tmp/dup"),
+        ]
+        with pytest.raises(ContextStoreError):
+            context_store.add_many(batch)
+        assert not context_store.exists("fresh")
+
+    def test_add_many_rejects_duplicate_within_batch(self, context_store):
+        from cam.storage.context_store import ContextStoreError
+
+        batch = [Context(name="same", path="/a"), Context(name="same", path="/b")]
+        with pytest.raises(ContextStoreError):
+            context_store.add_many(batch)
+        assert context_store.list() == []
+
 
 class TestAgentStore:
     def _make_agent(self):
@@ -115,6 +157,29 @@ class TestAgentStore:
         assert retrieved.status == AgentStatus.COMPLETED
         assert retrieved.exit_reason == "Done"
 
+    def test_bulk_update_status(self, agent_store):
+        a1 = self._make_agent()
+        a2 = self._make_agent()
+        agent_store.save(a1)
+        agent_store.save(a2)
+        agent_store.bulk_update_status(
+            [
+                (a1.id, AgentStatus.FAILED, "TMUX session disappeared"),
+                (a2.id, AgentStatus.COMPLETED, None),
+                ("missing", AgentStatus.FAILED, "ignored"),
+            ],
+        )
+        agent_store.add_events(
+            [AgentEvent(agent_id=a1.id, event_type="agent_orphaned", detail={"session": "s"})]
+        )
+
+        r1 = agent_store.get(a1.id)
+        assert r1.status == AgentStatus.FAILED
+        assert r1.exit_reason == "TMUX session disappeared"
+        assert r1.completed_at is not None
+        assert agent_store.get(a2.id).status == AgentStatus.COMPLETED
+        assert [e.event_type for e in agent_store.get_events(a1.id)] == ["agent_orphaned"]
+
     def test_add_and_get_events(self, agent_store):
         agent = self._make_agent()
         agent_store.save(agent)
@@ -130,8 +195,51 @@ class TestAgentStore:
         assert len(events) == 1
         assert events[0].event_type == "state_change"
 
+    def test_event_detail_roundtrip(self, agent_store):
+        agent = self._make_agent()
+        agent_store.save(agent)
+        detail = {"msg": "café ✓", "nested": {"n": [1, 2.5, None, True]}}
+        agent_store.add_event(AgentEvent(agent_id=agent.id, event_type="note", detail=detail))
+        assert agent_store.get_events(agent.id)[0].detail == detail
+
+    def test_concurrent_store_calls_from_threads(self, agent_store):
+        from concurrent.futures import ThreadPoolExecutor
+
+        agents = [self._make_agent() for _ in range(40)]
+
+        def roundtrip(agent):
+            agent_store.save(agent)
+            agent_store.update_status(agent.id, AgentStatus.COMPLETED)
+            return agent_store.get(agent.id).status
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            statuses = list(pool.map(roundtrip, agents))
+        assert statuses == [AgentStatus.COMPLETED] * len(agents)
+        assert len(agent_store.list()) == len(agents)
+
     def test_delete(self, agent_store):
         agent = self._make_agent()
         agent_store.save(agent)
         assert agent_store.delete(agent.id)
         assert agent_store.get(agent.id) is None
+
+
+class TestDatabase:
+    def test_transaction_excludes_other_threads(self, tmp_db):
+        import threading
+
+        tmp_db.execute("CREATE TABLE t (v TEXT)")
+        other = threading.Thread(
+            target=tmp_db.execute, args=("INSERT INTO t VALUES ('other')",)
+        )
+        with pytest.raises(RuntimeError):
+            with tmp_db.transaction():
+                tmp_db.execute("INSERT INTO t VALUES ('mine')")
+                other.start()
+                other.join(timeout=0.2)
+                # Blocked on the connection lock until the transaction ends
+                assert other.is_alive()
+                raise RuntimeError("roll back")
+        other.join()
+        # The rollback discarded only this transaction's statement
+        assert [r["v"] for r in tmp_db.fetchall("SELECT v FROM t")] == ["other"]
@@ -28,3 +28,33 @@ class TestStripAnsi:
     def test_csi_with_question_mark(self):
         # CSI ? sequences (e.g. cursor show/hide)
         assert strip_ansi("\x1B[?25hVisible") == "Visible"
+
+
+class TestAgentLogger:
+    def test_write_and_read_lines(self, tmp_path):
+        from cam.utils.logging import AgentLogger
+
+        with AgentLogger("agent-1", log_dir=tmp_path) as logger:
+            logger.write("start", data={"cmd": "ls", "when": tmp_path})
+            logger.write("output", output="héllo ✓")
+            logger.write("stop")
+
+        with open(logger.log_path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+
+        entries = logger.read_lines()
+        assert [e["type"] for e in entries] == ["start", "output", "stop"]
+        assert entries[0]["data"] == {"cmd": "ls", "when": str(tmp_path)}
+        assert entries[1]["output"] == "héllo ✓"
+        assert logger.read_lines(tail=2)[0]["type"] == "stop"
+
+    def test_write_values_orjson_rejects(self, tmp_path):
+        from cam.utils.logging import AgentLogger
+
+        with AgentLogger("agent-1", log_dir=tmp_path) as logger:
+            logger.write("big", data={"n": 2**70})
+            logger.write("keys", data={1: "one", None: "none"})
+
+        big, keys = logger.read_lines()
+        assert big["data"] == {"n": 2**70}
+        assert keys["data"] == {"1": "one", "null": "none"}